@@ -4,28 +4,91 @@ Supports environment variables and configurable paths.
 """
 import os
 import re
+import atexit
 import logging
-import uuid
+import secrets
 import time
 import threading
+import heapq
+import json
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from pymongo import MongoClient
 from pymongo.errors import PyMongoError, InvalidURI
 
+# Optional: shared session store for multi-worker deployments
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+
+def _env_str(name, default):
+    return field(default_factory=lambda: os.getenv(name, default))
+
+def _env_int(name, default):
+    return field(default_factory=lambda: int(os.getenv(name, str(default))))
+
+def _env_bool(name, default):
+    return field(default_factory=lambda: os.getenv(name, str(default)).lower() == 'true')
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Environment variable configuration, read once at import time."""
+    log_level: str = _env_str('LOG_LEVEL', 'INFO')
+    log_file: str = _env_str('MI_LOG_FILE', 'insights.log')
+    host: str = _env_str('MI_HOST', '127.0.0.1')
+    port: int = _env_int('MI_PORT', 3030)
+    max_file_size: int = _env_int('MI_MAX_FILE_SIZE', 10 * 1024 * 1024 * 1024)  # 10GB default
+    secure_cookies: bool = _env_bool('MI_SECURE_COOKIES', True)
+    ssl_enabled: bool = _env_bool('MI_SSL_ENABLED', False)
+    ssl_cert_path: str = _env_str('MI_SSL_CERT', '/etc/letsencrypt/live/your-domain/fullchain.pem')
+    ssl_key_path: str = _env_str('MI_SSL_KEY', '/etc/letsencrypt/live/your-domain/privkey.pem')
+    refresh_time: int = _env_int('MI_REFRESH_TIME', 10)
+    result_cache_ttl: int = _env_int('MI_RESULT_CACHE_TTL', -1)  # -1: one second less than the refresh time
+    connection_string: str = _env_str('MI_CONNECTION_STRING', '')
+    progress_endpoint_url: str = _env_str('MI_PROGRESS_ENDPOINT_URL', '')
+    internal_db_name: str = _env_str('MI_INTERNAL_DB_NAME', "mongosync_reserved_for_internal_use")
+    plot_width: int = _env_int('MI_PLOT_WIDTH', 1450)
+    plot_height: int = _env_int('MI_PLOT_HEIGHT', 1800)
+    max_partitions_display: int = _env_int('MI_MAX_PARTITIONS_DISPLAY', 10)
+    max_plot_points: int = _env_int('MI_MAX_PLOT_POINTS', 5000)  # 0: plot every point
+    pool_size: int = _env_int('MI_POOL_SIZE', 200)
+    min_pool_size: int = _env_int('MI_MIN_POOL_SIZE', 10)
+    max_idle_ms: int = _env_int('MI_MAX_IDLE_MS', 300000)  # 5 minutes
+    timeout_ms: int = _env_int('MI_TIMEOUT_MS', 5000)
+    compressors: str = _env_str('MI_COMPRESSORS', 'zstd,snappy,zlib')
+    session_timeout: int = _env_int('MI_SESSION_TIMEOUT', 3600)  # 1 hour default
+    session_redis_url: str = _env_str('MI_SESSION_REDIS_URL', '')
+    session_secret_key: str = _env_str('MI_SESSION_SECRET_KEY', '')
+
+CFG = _Config()
+
 # Environment variable configuration
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = os.getenv('MI_LOG_FILE', 'insights.log')
-HOST = os.getenv('MI_HOST', '127.0.0.1')
-PORT = int(os.getenv('MI_PORT', '3030'))
+LOG_LEVEL = CFG.log_level
+LOG_FILE = CFG.log_file
+HOST = CFG.host
+PORT = CFG.port
 
 # Application constants
 APP_NAME = "Mongosync Insights"
 APP_VERSION = "0.7.1.6"
 
 # File upload settings
-MAX_FILE_SIZE = int(os.getenv('MI_MAX_FILE_SIZE', str(10 * 1024 * 1024 * 1024)))  # 10GB default
+MAX_FILE_SIZE = CFG.max_file_size
 ALLOWED_EXTENSIONS = {'.log', '.json', '.out', '.gz', '.zip', '.bz2', '.tar.gz', '.tgz', '.tar.bz2'}
+# Allowed extensions for str.endswith(), longest (compound) first so '.tar.gz' matches before '.gz'
+ALLOWED_EXTENSIONS_SUFFIXES = tuple(sorted(ALLOWED_EXTENSIONS, key=len, reverse=True))
 ALLOWED_MIME_TYPES = [
     'application/x-ndjson',
     'application/gzip', 'application/x-gzip',
@@ -55,25 +118,26 @@ EXTENSION_TO_COMPRESSION = {
 }
 
 # Security settings
-SECURE_COOKIES = os.getenv('MI_SECURE_COOKIES', 'True').lower() == 'true'
+SECURE_COOKIES = CFG.secure_cookies
 
 # SSL/TLS settings
-SSL_ENABLED = os.getenv('MI_SSL_ENABLED', 'False').lower() == 'true'
-SSL_CERT_PATH = os.getenv('MI_SSL_CERT', '/etc/letsencrypt/live/your-domain/fullchain.pem')
-SSL_KEY_PATH = os.getenv('MI_SSL_KEY', '/etc/letsencrypt/live/your-domain/privkey.pem')
+SSL_ENABLED = CFG.ssl_enabled
+SSL_CERT_PATH = CFG.ssl_cert_path
+SSL_KEY_PATH = CFG.ssl_key_path
 
 # Live monitoring settings
-REFRESH_TIME = int(os.getenv('MI_REFRESH_TIME', '10'))
-CONNECTION_STRING = os.getenv('MI_CONNECTION_STRING', '')
-PROGRESS_ENDPOINT_URL = os.getenv('MI_PROGRESS_ENDPOINT_URL', '')
+REFRESH_TIME = CFG.refresh_time
+CONNECTION_STRING = CFG.connection_string
+PROGRESS_ENDPOINT_URL = CFG.progress_endpoint_url
 
 # MongoDB settings
-INTERNAL_DB_NAME = os.getenv('MI_INTERNAL_DB_NAME', "mongosync_reserved_for_internal_use")
+INTERNAL_DB_NAME = CFG.internal_db_name
 
 # UI settings
-PLOT_WIDTH = int(os.getenv('MI_PLOT_WIDTH', '1450'))
-PLOT_HEIGHT = int(os.getenv('MI_PLOT_HEIGHT', '1800'))
-MAX_PARTITIONS_DISPLAY = int(os.getenv('MI_MAX_PARTITIONS_DISPLAY', '10'))
+PLOT_WIDTH = CFG.plot_width
+PLOT_HEIGHT = CFG.plot_height
+MAX_PARTITIONS_DISPLAY = CFG.max_partitions_display
+MAX_PLOT_POINTS = CFG.max_plot_points
 
 def setup_logging():
     """Configure logging based on environment variables."""
@@ -85,6 +149,18 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+def is_allowed_filename(filename):
+    """
+    Check whether a filename ends with one of the allowed upload extensions.
+    
+    Args:
+        filename (str): Filename to check
+        
+    Returns:
+        bool: True if the extension (including compound ones like .tar.gz) is allowed
+    """
+    return filename.lower().endswith(ALLOWED_EXTENSIONS_SUFFIXES)
+
 def get_app_info():
     """Get application information."""
     return {
@@ -110,8 +186,43 @@ def validate_config():
     if not (1 <= PORT <= 65535):
         raise ValueError(f"Invalid port number: {PORT}. Must be between 1 and 65535.")
     
+    # Validate connection pool settings (MI_POOL_SIZE, MI_MIN_POOL_SIZE, MI_MAX_IDLE_MS)
+    if CONNECTION_POOL_SIZE < 1:
+        raise ValueError(f"Invalid pool size: {CONNECTION_POOL_SIZE}. Must be at least 1.")
+    if not (0 <= CONNECTION_MIN_POOL_SIZE <= CONNECTION_POOL_SIZE):
+        raise ValueError(f"Invalid minimum pool size: {CONNECTION_MIN_POOL_SIZE}. Must be between 0 and {CONNECTION_POOL_SIZE}.")
+    if CONNECTION_MAX_IDLE_MS < 0:
+        raise ValueError(f"Invalid max idle time: {CONNECTION_MAX_IDLE_MS}. Must not be negative.")
+    
+    # Validate result cache TTL (MI_RESULT_CACHE_TTL)
+    if CFG.result_cache_ttl < -1:
+        raise ValueError(f"Invalid result cache TTL: {CFG.result_cache_ttl}. Must be -1 (default) or at least 0.")
+    
+    # Validate the partitions display limit (MI_MAX_PARTITIONS_DISPLAY)
+    if MAX_PARTITIONS_DISPLAY < 1:
+        raise ValueError(f"Invalid max partitions display: {MAX_PARTITIONS_DISPLAY}. Must be at least 1.")
+    
+    # Validate the log plot point limit (MI_MAX_PLOT_POINTS)
+    if MAX_PLOT_POINTS != 0 and MAX_PLOT_POINTS < 4:
+        raise ValueError(f"Invalid max plot points: {MAX_PLOT_POINTS}. Must be 0 (no limit) or at least 4.")
+    
+    # Validate Redis session store settings (MI_SESSION_REDIS_URL, MI_SESSION_SECRET_KEY)
+    if SESSION_REDIS_URL:
+        if redis is None or Fernet is None:
+            raise ValueError("MI_SESSION_REDIS_URL requires the 'redis' and 'cryptography' packages to be installed.")
+        if not SESSION_SECRET_KEY:
+            raise ValueError("MI_SESSION_SECRET_KEY must be set when MI_SESSION_REDIS_URL is used.")
+        try:
+            Fernet(SESSION_SECRET_KEY)
+        except ValueError:
+            raise ValueError("Invalid MI_SESSION_SECRET_KEY: must be a url-safe base64-encoded 32-byte key.")
+    
     return True
 
+# Expected Progress Endpoint URL format: host:port/api/v1/progress
+# ASCII-only and length-bounded (max hostname length, 5 digit port)
+PROGRESS_ENDPOINT_URL_PATTERN = re.compile(r'\A[A-Za-z0-9_.\-]{1,253}:[0-9]{1,5}/api/v1/progress\Z')
+
 def validate_progress_endpoint_url(url):
     """
     Validate Mongosync Progress Endpoint URL format.
@@ -124,19 +235,54 @@ def validate_progress_endpoint_url(url):
     """
     if not url:
         return False
-    pattern = r'^[\w\.\-]+:\d+/api/v1/progress$'
-    return bool(re.match(pattern, url))
+    return bool(PROGRESS_ENDPOINT_URL_PATTERN.match(url))
 
 # Database Connection Management
 # Connection pool settings
-CONNECTION_POOL_SIZE = int(os.getenv('MI_POOL_SIZE', '10'))
-CONNECTION_TIMEOUT_MS = int(os.getenv('MI_TIMEOUT_MS', '5000'))
+CONNECTION_POOL_SIZE = CFG.pool_size
+CONNECTION_MIN_POOL_SIZE = CFG.min_pool_size
+CONNECTION_MAX_IDLE_MS = CFG.max_idle_ms
+CONNECTION_TIMEOUT_MS = CFG.timeout_ms
+# Wire protocol compressors in order of preference (zstd/snappy need the optional zstandard/python-snappy packages)
+CONNECTION_COMPRESSORS = CFG.compressors
+
+# Number of distinct connection strings whose clients (and pools) are kept alive
+CLIENT_CACHE_SIZE = 16
+
+# Accepted MongoDB connection string schemes
+MONGODB_URI_SCHEMES = ('mongodb://', 'mongodb+srv://')
+
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def parse_connection_string(connection_string):
+    """
+    Parse and validate a MongoDB connection string, caching the result.
+    
+    Args:
+        connection_string (str): MongoDB connection string
+        
+    Returns:
+        dict: Parsed URI components (treat as read-only)
+        
+    Raises:
+        InvalidURI: If the connection string is invalid
+    """
+    from pymongo.uri_parser import parse_uri
+    return parse_uri(connection_string)
+
+# Cached clients keyed by connection string, in least recently used order
+_client_cache = OrderedDict()
+_client_cache_lock = threading.Lock()
+# Connection strings whose cached client has answered a ping
+_verified_connections = set()
 
-@lru_cache(maxsize=1)
 def get_mongo_client(connection_string):
     """
     Get a cached MongoDB client with connection pooling.
     
+    Up to CLIENT_CACHE_SIZE clients are kept, evicting the least recently
+    used one. The client is created lazily and is not pinged here; call
+    verify_client() when connectivity needs to be confirmed.
+    
     Args:
         connection_string (str): MongoDB connection string
         
@@ -145,31 +291,65 @@ def get_mongo_client(connection_string):
         
     Raises:
         InvalidURI: If the connection string is invalid
-        PyMongoError: If connection fails
+        PyMongoError: If the client cannot be created
+    """
+    with _client_cache_lock:
+        client = _client_cache.get(connection_string)
+        if client is not None:
+            _client_cache.move_to_end(connection_string)
+            return client
+    
+    client = create_mongo_client(connection_string)
+    
+    with _client_cache_lock:
+        existing = _client_cache.get(connection_string)
+        if existing is not None:
+            # Another thread created a client for the same connection string first
+            client.close()
+            _client_cache.move_to_end(connection_string)
+            return existing
+        _client_cache[connection_string] = client
+        if len(_client_cache) > CLIENT_CACHE_SIZE:
+            evicted, _ = _client_cache.popitem(last=False)
+            _verified_connections.discard(evicted)
+    return client
+
+def create_mongo_client(connection_string):
+    """
+    Create a MongoDB client with connection pooling.
+    
+    Args:
+        connection_string (str): MongoDB connection string
+        
+    Returns:
+        MongoClient: New MongoDB client instance
+        
+    Raises:
+        InvalidURI: If the connection string is invalid
+        PyMongoError: If the client cannot be created
     """
     logger = logging.getLogger(__name__)
     
     try:
-        # Validate connection string format
-        from pymongo.uri_parser import parse_uri
-        parse_uri(connection_string)
+        # Cheap scheme check; MongoClient parses the URI itself and raises on deeper errors
+        if not connection_string.startswith(MONGODB_URI_SCHEMES):
+            raise InvalidURI("Invalid URI scheme: URI must begin with 'mongodb://' or 'mongodb+srv://'")
         
         # Create client with connection pooling
         client = MongoClient(
             connection_string,
             maxPoolSize=CONNECTION_POOL_SIZE,
-            minPoolSize=1,
-            maxIdleTimeMS=30000,  # 30 seconds
+            minPoolSize=CONNECTION_MIN_POOL_SIZE,
+            maxIdleTimeMS=CONNECTION_MAX_IDLE_MS,
+            compressors=CONNECTION_COMPRESSORS,
+            zlibCompressionLevel=-1,
             serverSelectionTimeoutMS=CONNECTION_TIMEOUT_MS,
             connectTimeoutMS=CONNECTION_TIMEOUT_MS,
             socketTimeoutMS=CONNECTION_TIMEOUT_MS,
             retryWrites=True,
             retryReads=True
         )
-        
-        # Test the connection
-        client.admin.command('ping')
-        logger.info(f"Successfully connected to MongoDB with pool size {CONNECTION_POOL_SIZE}")
+        logger.info(f"Created MongoDB client with pool size {CONNECTION_POOL_SIZE}")
         
         return client
         
@@ -177,12 +357,34 @@ def get_mongo_client(connection_string):
         logger.error(f"Invalid MongoDB connection string: {e}")
         raise
     except PyMongoError as e:
-        logger.error(f"Failed to connect to MongoDB: {e}")
+        logger.error(f"Failed to create MongoDB client: {e}")
         raise
+    except ValueError as e:
+        # MongoClient reports some malformed URIs (e.g. a non-numeric port) as ValueError
+        logger.error(f"Invalid MongoDB connection string: {e}")
+        raise InvalidURI(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error connecting to MongoDB: {e}")
+        logger.error(f"Unexpected error creating MongoDB client: {e}")
         raise PyMongoError(f"Connection failed: {e}")
 
+def verify_client(client):
+    """
+    Test connectivity of a MongoDB client with a ping.
+    
+    Args:
+        client (MongoClient): Client to test
+        
+    Returns:
+        bool: True if the server responded to the ping
+        
+    Raises:
+        PyMongoError: If the ping fails
+    """
+    logger = logging.getLogger(__name__)
+    result = client.admin.command('ping')
+    logger.info("Successfully connected to MongoDB")
+    return result.get('ok', 0) == 1
+
 def get_database(connection_string, database_name):
     """
     Get a database instance using the cached client.
@@ -201,6 +403,9 @@ def validate_connection(connection_string):
     """
     Validate a MongoDB connection string and test connectivity.
     
+    The ping is only sent the first time a cached client is validated;
+    later submits of the same connection string reuse that result.
+    
     Args:
         connection_string (str): MongoDB connection string to validate
         
@@ -211,32 +416,162 @@ def validate_connection(connection_string):
         InvalidURI: If the connection string format is invalid
         PyMongoError: If connection test fails
     """
+    with _client_cache_lock:
+        if connection_string in _verified_connections:
+            _client_cache.move_to_end(connection_string)
+            return True
+    
     try:
         # This will use the cached client or create a new one
         client = get_mongo_client(connection_string)
         # Test with a simple command
-        result = client.admin.command('ping')
-        return result.get('ok', 0) == 1
+        if not verify_client(client):
+            return False
+        with _client_cache_lock:
+            if connection_string in _client_cache:
+                _verified_connections.add(connection_string)
+        return True
     except Exception as e:
-        # Clear the cache if connection fails
-        get_mongo_client.cache_clear()
+        # Drop only the failing client; clients for other connection strings stay cached
+        evict_mongo_client(connection_string)
         raise
 
+def evict_mongo_client(connection_string):
+    """
+    Remove a single client from the connection cache and close it.
+    
+    Args:
+        connection_string (str): MongoDB connection string of the client to remove
+    """
+    with _client_cache_lock:
+        client = _client_cache.pop(connection_string, None)
+        _verified_connections.discard(connection_string)
+    if client is not None:
+        client.close()
+
 def clear_connection_cache():
     """
-    Clear the connection cache. Useful when connection strings change.
+    Clear the connection cache, closing all cached clients.
+    Useful when connection strings change.
     """
     logger = logging.getLogger(__name__)
-    get_mongo_client.cache_clear()
+    with _client_cache_lock:
+        clients = list(_client_cache.values())
+        _client_cache.clear()
+        _verified_connections.clear()
+    for client in clients:
+        client.close()
+    parse_connection_string.cache_clear()
     logger.info("MongoDB connection cache cleared")
 
+# Close pooled connections cleanly on interpreter shutdown
+atexit.register(clear_connection_cache)
+
 
 # =============================================================================
-# In-Memory Session Store
+# Refresh Result Cache
+# =============================================================================
+
+# Dashboard results are shared by every browser polling the same cluster or
+# endpoint, by default for just under one refresh interval (0 disables sharing
+# except between concurrent requests)
+RESULT_CACHE_TTL = CFG.result_cache_ttl if CFG.result_cache_ttl >= 0 else max(1, REFRESH_TIME - 1)
+RESULT_CACHE_SIZE = 64
+# For callers that accept it, an expired result is still returned for this long
+# while it is recomputed in the background, so a dashboard refresh does not
+# wait on MongoDB or the progress endpoint; older results are recomputed in
+# the request
+RESULT_STALE_GRACE = 2 * REFRESH_TIME if RESULT_CACHE_TTL > 0 else 0
+
+# Cached results keyed by (kind, source), in insertion order, with one lock
+# per key so concurrent requests for the same key wait for a single computation
+_result_cache = OrderedDict()
+_result_key_locks = {}
+_result_cache_lock = threading.Lock()
+_result_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mi-refresh")
+
+def _compute_result(key, compute):
+    """Compute and cache a result; the caller holds the key's lock."""
+    try:
+        result = compute()
+    except Exception:
+        with _result_cache_lock:
+            if key not in _result_cache:
+                _result_key_locks.pop(key, None)
+        raise
+    
+    with _result_cache_lock:
+        _result_cache.pop(key, None)
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, result)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            evicted, _ = _result_cache.popitem(last=False)
+            _result_key_locks.pop(evicted, None)
+    return result
+
+def _refresh_result(key, compute, key_lock):
+    """Recompute a stale result in the background, releasing the key's lock when done."""
+    try:
+        _compute_result(key, compute)
+    except Exception as e:
+        # The stale result is kept; once past the grace period the next
+        # request recomputes it and reports the error
+        logging.getLogger(__name__).warning(f"Background refresh of {key[0]} failed: {e}")
+    finally:
+        key_lock.release()
+
+def get_cached_result(key, compute, serve_stale=False):
+    """
+    Get a recently computed result, or compute and cache it.
+    
+    Concurrent callers asking for the same key while it is being computed
+    wait for that computation instead of repeating it. Exceptions are not
+    cached.
+    
+    Args:
+        key (tuple): Hashable cache key, e.g. ('metrics', connection_string)
+        compute (callable): Function returning the result when it is not cached
+        serve_stale (bool): Return a result expired less than RESULT_STALE_GRACE
+            seconds ago right away and recompute it in the background
+        
+    Returns:
+        The cached or newly computed result
+    """
+    entry = _result_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    with _result_cache_lock:
+        key_lock = _result_key_locks.setdefault(key, threading.Lock())
+    
+    if serve_stale and entry is not None and entry[0] + RESULT_STALE_GRACE > now:
+        # Start a refresh unless one is already running
+        if key_lock.acquire(blocking=False):
+            try:
+                _result_refresh_executor.submit(_refresh_result, key, compute, key_lock)
+            except Exception:
+                key_lock.release()
+                raise
+        return entry[1]
+    
+    with key_lock:
+        # Another request may have refreshed the entry while we waited
+        entry = _result_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        return _compute_result(key, compute)
+
+
+# =============================================================================
+# Session Store
 # =============================================================================
 
 # Session settings
-SESSION_TIMEOUT = int(os.getenv('MI_SESSION_TIMEOUT', '3600'))  # 1 hour default
+SESSION_TIMEOUT = CFG.session_timeout
+SESSION_REDIS_URL = CFG.session_redis_url
+SESSION_SECRET_KEY = CFG.session_secret_key
+SESSION_STORE_SHARDS = 16  # Must be a power of two
 
 class InMemorySessionStore:
     """
@@ -244,13 +579,56 @@ class InMemorySessionStore:
     
     This replaces Flask's built-in session with a simple server-side store.
     Session IDs are stored in cookies, but credentials stay on the server.
+    
+    Sessions are striped across SESSION_STORE_SHARDS shards, each with its
+    own dict, lock and expiry heap, so concurrent inserts and removals of
+    different sessions rarely contend. Lookups and updates rely on single dict
+    operations being atomic and do not take a lock at all.
+    
+    Expirations are tracked in a per-shard min-heap of (expires_at, session_id)
+    so cleanup only visits sessions that may have expired. Entries are refreshed
+    lazily: an entry whose session was accessed since it was pushed is
+    re-pushed with the new expiration when it reaches the top.
+    
+    Expiry uses time.monotonic() so wall clock adjustments cannot expire or
+    extend sessions.
     """
     
-    def __init__(self, timeout=SESSION_TIMEOUT):
-        self._store = {}
-        self._lock = threading.Lock()
+    def __init__(self, timeout=SESSION_TIMEOUT, shards=SESSION_STORE_SHARDS):
+        self._shards = [{} for _ in range(shards)]
+        self._expiry_heaps = [[] for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._shard_mask = shards - 1
         self._timeout = timeout
         self._logger = logging.getLogger(__name__)
+        self._cleanup_lock = threading.Lock()
+        self._cleanup_pid = None
+    
+    def _shard_index(self, session_id: str) -> int:
+        """Get the index of the shard holding the given session ID."""
+        return hash(session_id) & self._shard_mask
+    
+    def _ensure_cleanup_thread(self):
+        """
+        Start the background cleanup thread if it is not running in this process.
+        
+        Threads do not survive fork(), so the owning process ID is tracked and
+        a forked worker starts its own thread on first use.
+        """
+        pid = os.getpid()
+        if self._cleanup_pid == pid:
+            return
+        with self._cleanup_lock:
+            if self._cleanup_pid == pid:
+                return
+            thread = threading.Thread(
+                target=_run_session_cleanup,
+                args=(weakref.ref(self), max(self._timeout / 4, 1)),
+                name="session-cleanup",
+                daemon=True
+            )
+            thread.start()
+            self._cleanup_pid = pid
     
     def create_session(self, data: dict) -> str:
         """
@@ -262,43 +640,53 @@ class InMemorySessionStore:
         Returns:
             str: Unique session ID
         """
-        session_id = str(uuid.uuid4())
-        with self._lock:
-            self._store[session_id] = {
+        self._ensure_cleanup_thread()
+        session_id = secrets.token_urlsafe(16)
+        current_time = time.monotonic()
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            self._shards[index][session_id] = {
                 'data': data,
-                'created_at': time.time(),
-                'last_accessed': time.time()
+                'created_at': time.time(),  # Wall clock, informational only
+                'last_accessed': current_time
             }
+            heapq.heappush(self._expiry_heaps[index], (current_time + self._timeout, session_id))
         self._logger.debug(f"Created session: {session_id[:8]}...")
         return session_id
     
-    def get_session(self, session_id: str) -> dict:
+    def get_session(self, session_id: str, copy: bool = False) -> Mapping:
         """
         Retrieve session data by session ID.
         
         Args:
             session_id: The session ID to look up
+            copy: Return a mutable copy instead of a read-only view
             
         Returns:
-            dict: Session data, or empty dict if not found/expired
+            Mapping: Read-only view of the session data (or a dict copy if
+            copy is True), or empty dict if not found/expired
         """
         if not session_id:
             return {}
             
-        with self._lock:
-            session = self._store.get(session_id)
-            if not session:
-                return {}
-            
-            # Check if session has expired
-            if time.time() - session['last_accessed'] > self._timeout:
-                del self._store[session_id]
-                self._logger.debug(f"Session expired: {session_id[:8]}...")
-                return {}
-            
-            # Update last accessed time
-            session['last_accessed'] = time.time()
+        index = self._shard_index(session_id)
+        session = self._shards[index].get(session_id)
+        if not session:
+            return {}
+        
+        # Check if session has expired
+        current_time = time.monotonic()
+        if current_time - session['last_accessed'] > self._timeout:
+            with self._locks[index]:
+                self._shards[index].pop(session_id, None)
+            self._logger.debug(f"Session expired: {session_id[:8]}...")
+            return {}
+        
+        # Update last accessed time
+        session['last_accessed'] = current_time
+        if copy:
             return session['data'].copy()
+        return MappingProxyType(session['data'])
     
     def update_session(self, session_id: str, data: dict) -> bool:
         """
@@ -314,12 +702,14 @@ class InMemorySessionStore:
         if not session_id:
             return False
             
-        with self._lock:
-            if session_id in self._store:
-                self._store[session_id]['data'] = data
-                self._store[session_id]['last_accessed'] = time.time()
-                return True
+        session = self._shards[self._shard_index(session_id)].get(session_id)
+        if session is None:
             return False
+        
+        # Last writer wins for concurrent updates of the same session
+        session['data'] = data
+        session['last_accessed'] = time.monotonic()
+        return True
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -334,32 +724,183 @@ class InMemorySessionStore:
         if not session_id:
             return False
             
-        with self._lock:
-            if session_id in self._store:
-                del self._store[session_id]
+        index = self._shard_index(session_id)
+        with self._locks[index]:
+            if self._shards[index].pop(session_id, None) is not None:
                 self._logger.debug(f"Deleted session: {session_id[:8]}...")
                 return True
             return False
     
     def cleanup_expired(self):
         """Remove all expired sessions."""
-        current_time = time.time()
-        with self._lock:
-            expired = [
-                sid for sid, session in self._store.items()
-                if current_time - session['last_accessed'] > self._timeout
-            ]
-            for sid in expired:
-                del self._store[sid]
-            if expired:
-                self._logger.debug(f"Cleaned up {len(expired)} expired sessions")
+        current_time = time.monotonic()
+        expired_count = 0
+        for store, expiry_heap, lock in zip(self._shards, self._expiry_heaps, self._locks):
+            with lock:
+                while expiry_heap and expiry_heap[0][0] < current_time:
+                    _, sid = heapq.heappop(expiry_heap)
+                    session = store.get(sid)
+                    if session is None:
+                        # Session was already deleted
+                        continue
+                    expires_at = session['last_accessed'] + self._timeout
+                    if expires_at < current_time:
+                        del store[sid]
+                        expired_count += 1
+                    else:
+                        # Session was accessed since this entry was pushed
+                        heapq.heappush(expiry_heap, (expires_at, sid))
+        if expired_count:
+            self._logger.debug(f"Cleaned up {expired_count} expired sessions")
+    
+    def get_active_count(self) -> int:
+        """
+        Get the number of stored sessions.
+        
+        Expired sessions are removed by the background cleanup thread, so the
+        count may include sessions that expired since its last run.
+        """
+        return sum(len(store) for store in self._shards)
+
+
+def _run_session_cleanup(store_ref, interval):
+    """Periodically remove expired sessions until the store is garbage collected."""
+    while True:
+        time.sleep(interval)
+        store = store_ref()
+        if store is None:
+            return
+        store.cleanup_expired()
+        del store
+
+
+class RedisSessionStore:
+    """
+    Redis-backed session store shared by all worker processes.
+    
+    Provides the same interface as InMemorySessionStore. Session data is
+    JSON-encoded and encrypted with Fernet (it contains credentials) before
+    being written, and expiry is handled by Redis key TTLs, which are reset on
+    every access.
+    
+    Requires the optional 'redis' and 'cryptography' packages; validate_config()
+    checks they are installed and that the secret key is valid.
+    """
+    
+    KEY_PREFIX = 'mi:session:'
+    
+    def __init__(self, url, secret_key, timeout=SESSION_TIMEOUT):
+        self._url = url
+        self._secret_key = secret_key
+        self._timeout = timeout
+        self._logger = logging.getLogger(__name__)
+    
+    @cached_property
+    def _redis(self):
+        """Redis client, created on first use (connections are opened lazily)."""
+        return redis.Redis.from_url(self._url)
+    
+    @cached_property
+    def _fernet(self):
+        """Cipher used to encrypt session data."""
+        return Fernet(self._secret_key)
+    
+    def _key(self, session_id: str) -> str:
+        """Get the Redis key holding the given session ID."""
+        return self.KEY_PREFIX + session_id
+    
+    def _encode(self, data: dict) -> bytes:
+        """Serialize and encrypt session data."""
+        return self._fernet.encrypt(json.dumps(data).encode())
+    
+    def create_session(self, data: dict) -> str:
+        """
+        Create a new session with the given data.
+        
+        Args:
+            data: Dictionary of session data to store
+            
+        Returns:
+            str: Unique session ID
+        """
+        session_id = secrets.token_urlsafe(16)
+        self._redis.set(self._key(session_id), self._encode(data), ex=self._timeout)
+        self._logger.debug(f"Created session: {session_id[:8]}...")
+        return session_id
+    
+    def get_session(self, session_id: str, copy: bool = False) -> Mapping:
+        """
+        Retrieve session data by session ID, extending its expiration.
+        
+        Args:
+            session_id: The session ID to look up
+            copy: Return a mutable copy instead of a read-only view
+            
+        Returns:
+            Mapping: Read-only view of the session data (or a dict if copy
+            is True), or empty dict if not found/expired
+        """
+        if not session_id:
+            return {}
+        
+        payload = self._redis.getex(self._key(session_id), ex=self._timeout)
+        if payload is None:
+            return {}
+        
+        try:
+            data = json.loads(self._fernet.decrypt(payload))
+        except InvalidToken:
+            self._logger.warning(f"Could not decrypt session: {session_id[:8]}...")
+            return {}
+        
+        # The decoded dict is not shared, so a copy is already private to the caller
+        if copy:
+            return data
+        return MappingProxyType(data)
+    
+    def update_session(self, session_id: str, data: dict) -> bool:
+        """
+        Update an existing session with new data.
+        
+        Args:
+            session_id: The session ID to update
+            data: New data to store
+            
+        Returns:
+            bool: True if session was updated, False if not found
+        """
+        if not session_id:
+            return False
+        return bool(self._redis.set(self._key(session_id), self._encode(data), ex=self._timeout, xx=True))
+    
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session.
+        
+        Args:
+            session_id: The session ID to delete
+            
+        Returns:
+            bool: True if session was deleted, False if not found
+        """
+        if not session_id:
+            return False
+        if self._redis.delete(self._key(session_id)):
+            self._logger.debug(f"Deleted session: {session_id[:8]}...")
+            return True
+        return False
+    
+    def cleanup_expired(self):
+        """Remove all expired sessions (no-op, Redis expires keys itself)."""
     
     def get_active_count(self) -> int:
-        """Get the number of active sessions."""
-        self.cleanup_expired()
-        with self._lock:
-            return len(self._store)
+        """Get the number of stored sessions."""
+        return sum(1 for _ in self._redis.scan_iter(match=self.KEY_PREFIX + '*', count=1000))
 
 
-# Global session store instance
-session_store = InMemorySessionStore()
+# Global session store instance; Redis when configured so that sessions are
+# shared between worker processes
+if SESSION_REDIS_URL:
+    session_store = RedisSessionStore(SESSION_REDIS_URL, SESSION_SECRET_KEY)
+else:
+    session_store = InMemorySessionStore()
@@ -4,7 +4,7 @@ Provides basic sanitization for display purposes.
 """
 import logging
 from html import escape
-from pymongo.uri_parser import parse_uri
+from app_config import parse_connection_string
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +26,7 @@ def sanitize_for_display(connection_string):
         str: Sanitized string safe for HTML display
     """
     try:
-        parsed = parse_uri(connection_string)
+        parsed = parse_connection_string(connection_string)
         hosts = parsed['nodelist']
         hosts_str = ", ".join([f"{escape(str(host))}:{escape(str(port))}" for host, port in hosts])
         
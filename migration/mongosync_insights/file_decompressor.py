@@ -7,117 +7,367 @@ import zipfile
 import bz2
 import tarfile
 import io
+import os
+import zlib
 import logging
-from typing import BinaryIO, Iterator
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, Optional
+from app_config import EXTENSION_TO_COMPRESSION, COMPRESSED_MIME_TYPES
 
 logger = logging.getLogger(__name__)
 
+# Optional accelerated decompressors, detected once at import time.
+# ISA-L provides SIMD-accelerated inflate; indexed_bzip2 decompresses bzip2 blocks in parallel.
+try:
+    from isal.igzip import IGzipFile as GzipReader
+except ImportError:
+    GzipReader = gzip.GzipFile
 
-def decompress_gzip(file_obj: BinaryIO) -> Iterator[bytes]:
+try:
+    from indexed_bzip2 import IndexedBzip2File
+except ImportError:
+    IndexedBzip2File = None
+
+# Size of decompressed blocks read before splitting into lines (1 MiB)
+READ_BLOCK_SIZE = 1 << 20
+
+# Zip members up to this size are inflated in parallel worker threads (64 MiB),
+# holding at most ZIP_READ_AHEAD_MAX_BYTES of inflated members in memory (128 MiB)
+ZIP_PARALLEL_MAX_MEMBER_SIZE = 64 << 20
+ZIP_READ_AHEAD_MAX_BYTES = 128 << 20
+ZIP_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def iter_lines_from_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
     """
-    Decompress a gzip file and yield lines.
+    Split a stream of byte chunks into lines.
+    
+    Lines are split in C with bytes.split(), carrying any partial line over
+    to the next chunk. Only newline bytes end a line, as when iterating a
+    file; bytes.splitlines() would also split on carriage returns, NEL and
+    other separators that can appear inside a log line's JSON strings.
     
     Args:
-        file_obj: File-like object containing gzip data
+        chunks: Iterable of byte chunks
         
     Yields:
-        Decompressed lines as bytes
+        Lines as bytes, including line endings
     """
-    file_obj.seek(0)
-    with gzip.GzipFile(fileobj=file_obj, mode='rb') as gz:
-        for line in gz:
-            yield line
+    buffer = b''
+    for chunk in chunks:
+        lines = (buffer + chunk).split(b'\n')
+        buffer = lines.pop()
+        for line in lines:
+            yield line + b'\n'
+    
+    # Yield any remaining data
+    if buffer:
+        yield buffer
 
 
-def decompress_bzip2(file_obj: BinaryIO) -> Iterator[bytes]:
+def iter_lines(stream: BinaryIO) -> Iterator[bytes]:
     """
-    Decompress a bzip2 file and yield lines.
+    Read a binary stream in large blocks and yield lines.
     
     Args:
-        file_obj: File-like object containing bzip2 data
+        stream: Readable binary stream
         
     Yields:
-        Decompressed lines as bytes
+        Lines as bytes, including line endings
+    """
+    return iter_lines_from_chunks(iter(lambda: stream.read(READ_BLOCK_SIZE), b''))
+
+
+class ConcatReader(io.RawIOBase):
+    """
+    Read-only raw stream that concatenates a sequence of binary streams.
+    
+    Used to expose the members of a zip or tar archive as a single stream.
+    A newline is inserted between members that do not end with one so that
+    the last line of a member is never joined with the first line of the next.
+    """
+    
+    def __init__(self, streams: Iterator[BinaryIO]):
+        self._streams = streams
+        self._current = None
+        self._pending_newline = False
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while True:
+            if self._current is None:
+                try:
+                    self._current = next(self._streams)
+                except StopIteration:
+                    return 0
+                if self._pending_newline:
+                    self._pending_newline = False
+                    buffer[0] = 0x0A
+                    return 1
+            
+            n = self._current.readinto(buffer)
+            if n:
+                self._pending_newline = buffer[n - 1] != 0x0A
+                return n
+            
+            # Current member exhausted, move on to the next one
+            self._current = None
+    
+    def close(self):
+        if not self.closed:
+            close_streams = getattr(self._streams, 'close', None)
+            if close_streams:
+                close_streams()
+        super().close()
+
+
+def open_gzip_stream(file_obj: BinaryIO) -> BinaryIO:
+    """
+    Open a gzip file as a decompressed binary stream.
+    
+    Args:
+        file_obj: File-like object containing gzip data
+        
+    Returns:
+        Readable binary stream of decompressed data
     """
     file_obj.seek(0)
-    decompressor = bz2.BZ2Decompressor()
-    buffer = b''
+    return GzipReader(fileobj=file_obj, mode='rb')
+
+
+def open_bzip2_stream(file_obj: BinaryIO) -> BinaryIO:
+    """
+    Open a bzip2 file as a decompressed binary stream.
     
-    while True:
-        chunk = file_obj.read(8192)
-        if not chunk:
-            break
-        try:
-            decompressed = decompressor.decompress(chunk)
-            buffer += decompressed
-            while b'\n' in buffer:
-                line, buffer = buffer.split(b'\n', 1)
-                yield line + b'\n'
-        except EOFError:
-            break
+    Args:
+        file_obj: File-like object containing bzip2 data
+        
+    Returns:
+        Readable binary stream of decompressed data
+    """
+    file_obj.seek(0)
+    if IndexedBzip2File is not None:
+        return IndexedBzip2File(file_obj, parallelization=os.cpu_count() or 1)
+    return bz2.BZ2File(file_obj, mode='rb')
+
+
+def read_zip_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """
+    Decompress a single zip member fully into memory.
     
-    # Yield any remaining data
-    if buffer:
-        yield buffer
+    Args:
+        zf: Open zip archive
+        info: Member to decompress
+        
+    Returns:
+        Decompressed member contents
+    """
+    with zf.open(info) as inner_file:
+        inner_file.MIN_READ_SIZE = READ_BLOCK_SIZE
+        return inner_file.read()
 
 
-def decompress_zip(file_obj: BinaryIO) -> Iterator[bytes]:
+def threads_are_patched() -> bool:
+    """Check whether gevent has replaced threads with greenlets in this process."""
+    monkey = sys.modules.get('gevent.monkey')
+    return monkey is not None and monkey.is_module_patched('threading')
+
+
+def iter_zip_members(file_obj: BinaryIO) -> Iterator[BinaryIO]:
     """
-    Decompress a zip archive and yield lines from all contained files (concatenated).
+    Open each file contained in a zip archive in turn.
+    
+    Zip members are independently compressed, so up to ZIP_MAX_WORKERS
+    upcoming members are inflated ahead in worker threads (zlib releases
+    the GIL), as long as the inflated members held in memory, including the
+    one being read, stay within ZIP_READ_AHEAD_MAX_BYTES. Members larger than
+    ZIP_PARALLEL_MAX_MEMBER_SIZE are streamed instead, and so is every member
+    when threads are monkey-patched into greenlets, which could not inflate
+    in parallel. Members are yielded in archive order.
     
     Args:
         file_obj: File-like object containing zip data
         
     Yields:
-        Decompressed lines as bytes from all files in the archive
+        Readable binary stream for each file in the archive
     """
     file_obj.seek(0)
     with zipfile.ZipFile(file_obj, 'r') as zf:
-        file_list = zf.namelist()
-        logger.info(f"ZIP archive contains {len(file_list)} file(s): {file_list}")
+        # Skip directories
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        logger.info(f"ZIP archive contains {len(members)} file(s): {[info.filename for info in members]}")
         
-        for filename in file_list:
-            # Skip directories
-            if filename.endswith('/'):
-                continue
-            
-            logger.info(f"Processing file from ZIP: {filename}")
-            with zf.open(filename) as inner_file:
-                for line in inner_file:
-                    yield line
+        if threads_are_patched():
+            for info in members:
+                logger.info(f"Processing file from ZIP: {info.filename}")
+                with zf.open(info) as inner_file:
+                    inner_file.MIN_READ_SIZE = READ_BLOCK_SIZE
+                    yield inner_file
+            return
+        
+        remaining = iter(members)
+        upcoming = next(remaining, None)
+        window = deque()
+        # Inflated size of the members read ahead or being read
+        buffered = 0
+        executor = ThreadPoolExecutor(max_workers=ZIP_MAX_WORKERS)
+        
+        def fill_window():
+            nonlocal upcoming, buffered
+            while upcoming is not None and len(window) < ZIP_MAX_WORKERS:
+                info = upcoming
+                future = None
+                if info.file_size <= ZIP_PARALLEL_MAX_MEMBER_SIZE:
+                    if buffered + info.file_size > ZIP_READ_AHEAD_MAX_BYTES:
+                        return
+                    future = executor.submit(read_zip_member, zf, info)
+                    buffered += info.file_size
+                window.append((info, future))
+                upcoming = next(remaining, None)
+        
+        try:
+            fill_window()
+            while window:
+                info, future = window.popleft()
+                fill_window()
+                
+                logger.info(f"Processing file from ZIP: {info.filename}")
+                if future is not None:
+                    yield io.BytesIO(future.result())
+                    buffered -= info.file_size
+                    fill_window()
+                else:
+                    with zf.open(info) as inner_file:
+                        inner_file.MIN_READ_SIZE = READ_BLOCK_SIZE
+                        yield inner_file
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
 
-def decompress_tar(file_obj: BinaryIO, compression: str = 'gz') -> Iterator[bytes]:
+def iter_tar_members(file_obj: BinaryIO, compression: str = 'gz') -> Iterator[BinaryIO]:
     """
-    Decompress a tar archive (tar.gz or tar.bz2) and yield lines from all contained files (concatenated).
+    Open each regular file contained in a tar archive (tar.gz or tar.bz2) in turn.
     
     Args:
         file_obj: File-like object containing tar archive data
-        compression: Compression type - 'gz' for gzip, 'bz2' for bzip2
+        compression: Compression type - 'gz' for gzip, 'bz2' for bzip2, '' for uncompressed
         
     Yields:
-        Decompressed lines as bytes from all files in the archive
+        Readable binary stream for each file in the archive
     """
     file_obj.seek(0)
-    mode = f'r:{compression}'
+    # Stream mode ('r|') reads members in a single forward pass without indexing the archive first
+    mode = f'r|{compression}'
     
     with tarfile.open(fileobj=file_obj, mode=mode) as tf:
-        members = tf.getmembers()
-        file_names = [m.name for m in members if m.isfile()]
-        logger.info(f"TAR archive contains {len(file_names)} file(s): {file_names}")
-        
-        for member in members:
+        file_count = 0
+        for member in tf:
             # Skip directories and non-regular files
             if not member.isfile():
                 continue
             
+            file_count += 1
             logger.info(f"Processing file from TAR: {member.name}")
             inner_file = tf.extractfile(member)
             if inner_file:
-                for line in inner_file:
-                    yield line
+                yield inner_file
+        
+        logger.info(f"TAR archive contained {file_count} file(s)")
+
+
+def decompress_gzip(file_obj: BinaryIO) -> Iterator[bytes]:
+    """
+    Decompress a gzip file and yield lines.
+    
+    Args:
+        file_obj: File-like object containing gzip data
+        
+    Yields:
+        Decompressed lines as bytes
+    """
+    with open_gzip_stream(file_obj) as gz:
+        yield from iter_lines(gz)
 
 
+def decompress_bzip2(file_obj: BinaryIO) -> Iterator[bytes]:
+    """
+    Decompress a bzip2 file and yield lines.
+    
+    Args:
+        file_obj: File-like object containing bzip2 data
+        
+    Yields:
+        Decompressed lines as bytes
+    """
+    with open_bzip2_stream(file_obj) as bz:
+        yield from iter_lines(bz)
+
+
+def decompress_zip(file_obj: BinaryIO) -> Iterator[bytes]:
+    """
+    Decompress a zip archive and yield lines from all contained files (concatenated).
+    
+    Args:
+        file_obj: File-like object containing zip data
+        
+    Yields:
+        Decompressed lines as bytes from all files in the archive
+    """
+    for inner_file in iter_zip_members(file_obj):
+        yield from iter_lines(inner_file)
+
+
+def decompress_tar(file_obj: BinaryIO, compression: str = 'gz') -> Iterator[bytes]:
+    """
+    Decompress a tar archive (tar.gz or tar.bz2) and yield lines from all contained files (concatenated).
+    
+    Args:
+        file_obj: File-like object containing tar archive data
+        compression: Compression type - 'gz' for gzip, 'bz2' for bzip2
+        
+    Yields:
+        Decompressed lines as bytes from all files in the archive
+    """
+    for inner_file in iter_tar_members(file_obj, compression):
+        yield from iter_lines(inner_file)
+
+
+# Compound extensions checked before falling back to os.path.splitext
+COMPOUND_EXTENSIONS = ('.tar.gz', '.tar.bz2')
+
+# MIME type to compression type mapping
+MIME_TO_COMPRESSION = {
+    'application/gzip': 'gzip',
+    'application/x-gzip': 'gzip',
+    'application/zip': 'zip',
+    'application/x-zip-compressed': 'zip',
+    'application/x-bzip2': 'bzip2',
+    'application/x-tar': 'tar_gzip'  # Plain tar with gzip compression (common for tar.gz detected as x-tar)
+}
+
+# Compression types that are tar archives (detected by extension, since MIME detection may vary)
+TAR_COMPRESSION_TYPES = {'tar_gzip', 'tar_bzip2'}
+
+# Magic numbers at the start of compressed files
+GZIP_MAGIC = b'\x1f\x8b'
+ZIP_MAGIC = b'PK\x03\x04'
+BZIP2_MAGIC = b'BZh'
+
+# Tar headers carry 'ustar' at offset 257 of the first 512-byte block
+TAR_MAGIC = b'ustar'
+TAR_MAGIC_OFFSET = 257
+TAR_BLOCK_SIZE = 512
+
+# Bytes read from the start of a file for magic number detection
+MAGIC_SAMPLE_SIZE = 4096
+
+
+@lru_cache(maxsize=1024)
 def get_file_extension(filename: str) -> str:
     """
     Get the file extension, handling compound extensions like .tar.gz.
@@ -128,12 +378,10 @@ def get_file_extension(filename: str) -> str:
     Returns:
         The file extension (e.g., '.tar.gz', '.gz', '.zip')
     """
-    import os
     filename_lower = filename.lower()
     
     # Check for compound extensions first
-    compound_extensions = ['.tar.gz', '.tar.bz2']
-    for ext in compound_extensions:
+    for ext in COMPOUND_EXTENSIONS:
         if filename_lower.endswith(ext):
             return ext
     
@@ -141,63 +389,143 @@ def get_file_extension(filename: str) -> str:
     return os.path.splitext(filename)[1].lower()
 
 
-def decompress_file(file_obj: BinaryIO, mime_type: str, filename: str = None) -> Iterator[bytes]:
+def is_tar_header(block: bytes) -> bool:
+    """Check whether a block of data starts with a tar header."""
+    return block[TAR_MAGIC_OFFSET:TAR_MAGIC_OFFSET + len(TAR_MAGIC)] == TAR_MAGIC
+
+
+def detect_compression_type(file_obj: BinaryIO) -> Optional[str]:
     """
-    Decompress a file based on its MIME type and return an iterator over lines.
+    Detect the compression type of a file from its magic number.
+    
+    Gzip files are additionally checked for an embedded tar archive by
+    inflating the first tar block. Bzip2 only emits data per 100-900KB
+    block, so tar.bz2 archives are reported as 'bzip2' here.
+    
+    Args:
+        file_obj: Seekable file-like object (position is reset to the start)
+        
+    Returns:
+        Compression type: 'gzip', 'zip', 'bzip2', 'tar_gzip' or 'tar',
+        or None if no known magic number is found
+    """
+    file_obj.seek(0)
+    head = file_obj.read(MAGIC_SAMPLE_SIZE)
+    file_obj.seek(0)
+    
+    if head.startswith(GZIP_MAGIC):
+        try:
+            block = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, TAR_BLOCK_SIZE)
+        except zlib.error:
+            block = b''
+        return 'tar_gzip' if is_tar_header(block) else 'gzip'
+    if head.startswith(ZIP_MAGIC):
+        return 'zip'
+    if head.startswith(BZIP2_MAGIC):
+        return 'bzip2'
+    if is_tar_header(head):
+        return 'tar'
+    return None
+
+
+def get_compression_type(mime_type: str, filename: str = None, file_obj: BinaryIO = None) -> str:
+    """
+    Determine the compression type of a file from its MIME type and filename.
     
     Args:
-        file_obj: File-like object to decompress
         mime_type: Detected MIME type of the file
         filename: Original filename (used for extension-based detection when MIME is octet-stream or tar)
+        file_obj: File-like object (used for magic number detection when MIME is octet-stream)
         
     Returns:
-        Iterator yielding decompressed lines as bytes
+        Compression type: 'gzip', 'zip', 'bzip2', 'tar_gzip', 'tar_bzip2' or 'tar'
         
     Raises:
         ValueError: If the MIME type is not a supported compressed format
     """
-    from app_config import EXTENSION_TO_COMPRESSION
-    
-    logger.info(f"Decompressing file with MIME type: {mime_type}, filename: {filename}")
-    
     # Get file extension for tar archive detection
     ext = get_file_extension(filename) if filename else None
     compression_type = EXTENSION_TO_COMPRESSION.get(ext) if ext else None
     
     # Check for tar archives first (by extension, since MIME detection may vary)
-    if compression_type == 'tar_gzip':
-        logger.info(f"Using tar+gzip decompression based on file extension: {ext}")
-        return decompress_tar(file_obj, compression='gz')
-    elif compression_type == 'tar_bzip2':
-        logger.info(f"Using tar+bzip2 decompression based on file extension: {ext}")
-        return decompress_tar(file_obj, compression='bz2')
+    if compression_type in TAR_COMPRESSION_TYPES:
+        logger.info(f"Using {compression_type} decompression based on file extension: {ext}")
+        return compression_type
     
     # Handle by MIME type
-    if mime_type in ('application/gzip', 'application/x-gzip'):
-        return decompress_gzip(file_obj)
-    elif mime_type in ('application/zip', 'application/x-zip-compressed'):
-        return decompress_zip(file_obj)
-    elif mime_type == 'application/x-bzip2':
-        return decompress_bzip2(file_obj)
-    elif mime_type == 'application/x-tar':
-        # Plain tar with gzip compression (common for tar.gz detected as x-tar)
-        logger.info("Using tar+gzip decompression for application/x-tar")
-        return decompress_tar(file_obj, compression='gz')
-    elif mime_type == 'application/octet-stream' and filename:
+    mime_compression_type = MIME_TO_COMPRESSION.get(mime_type)
+    if mime_compression_type:
+        return mime_compression_type
+    
+    if mime_type == 'application/octet-stream' and file_obj is not None:
+        # Detect generic binary files by their magic number
+        magic_compression_type = detect_compression_type(file_obj)
+        if magic_compression_type:
+            logger.info(f"Using {magic_compression_type} decompression based on file signature")
+            return magic_compression_type
+    
+    if mime_type == 'application/octet-stream' and filename:
         # Fallback to extension-based detection for generic binary files
-        if compression_type == 'gzip':
-            logger.info(f"Using gzip decompression based on file extension: {ext}")
-            return decompress_gzip(file_obj)
-        elif compression_type == 'zip':
-            logger.info(f"Using zip decompression based on file extension: {ext}")
-            return decompress_zip(file_obj)
-        elif compression_type == 'bzip2':
-            logger.info(f"Using bzip2 decompression based on file extension: {ext}")
-            return decompress_bzip2(file_obj)
-        else:
-            raise ValueError(f"Cannot determine compression type for octet-stream file with extension: {ext}")
-    else:
-        raise ValueError(f"Unsupported compressed MIME type: {mime_type}")
+        if compression_type:
+            logger.info(f"Using {compression_type} decompression based on file extension: {ext}")
+            return compression_type
+        raise ValueError(f"Cannot determine compression type for octet-stream file with extension: {ext}")
+    
+    raise ValueError(f"Unsupported compressed MIME type: {mime_type}")
+
+
+# Compression type to decompressed stream opener
+STREAM_OPENERS = {
+    'gzip': open_gzip_stream,
+    'bzip2': open_bzip2_stream,
+    'zip': lambda file_obj: ConcatReader(iter_zip_members(file_obj)),
+    'tar_gzip': lambda file_obj: ConcatReader(iter_tar_members(file_obj, compression='gz')),
+    'tar_bzip2': lambda file_obj: ConcatReader(iter_tar_members(file_obj, compression='bz2')),
+    'tar': lambda file_obj: ConcatReader(iter_tar_members(file_obj, compression=''))
+}
+
+
+def decompress_file_stream(file_obj: BinaryIO, mime_type: str, filename: str = None) -> BinaryIO:
+    """
+    Decompress a file based on its MIME type and return a buffered binary stream.
+    
+    Iterating over the returned stream yields lines, split in C by the
+    buffered reader, without a Python-level generator per line.
+    
+    Args:
+        file_obj: File-like object to decompress
+        mime_type: Detected MIME type of the file
+        filename: Original filename (used for extension-based detection when MIME is octet-stream or tar)
+        
+    Returns:
+        Buffered binary stream of decompressed data
+        
+    Raises:
+        ValueError: If the MIME type is not a supported compressed format
+    """
+    logger.info(f"Decompressing file with MIME type: {mime_type}, filename: {filename}")
+    compression_type = get_compression_type(mime_type, filename, file_obj)
+    
+    raw = STREAM_OPENERS[compression_type](file_obj)
+    return io.BufferedReader(raw, buffer_size=READ_BLOCK_SIZE)
+
+
+def decompress_file(file_obj: BinaryIO, mime_type: str, filename: str = None) -> Iterator[bytes]:
+    """
+    Decompress a file based on its MIME type and return an iterator over lines.
+    
+    Args:
+        file_obj: File-like object to decompress
+        mime_type: Detected MIME type of the file
+        filename: Original filename (used for extension-based detection when MIME is octet-stream or tar)
+        
+    Returns:
+        Iterator yielding decompressed lines as bytes
+        
+    Raises:
+        ValueError: If the MIME type is not a supported compressed format
+    """
+    return iter_lines(decompress_file_stream(file_obj, mime_type, filename))
 
 
 def is_compressed_mime_type(mime_type: str) -> bool:
@@ -210,6 +538,5 @@ def is_compressed_mime_type(mime_type: str) -> bool:
     Returns:
         True if the MIME type is a supported compressed format
     """
-    from app_config import COMPRESSED_MIME_TYPES
     return mime_type in COMPRESSED_MIME_TYPES
 
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for running Mongosync Insights in production.
+
+Usage:
+    gunicorn -c gunicorn.conf.py mongosync_insights:app
+
+Uses threaded (gthread) workers so dashboard refreshes keep being served while
+another request is busy, including a log upload whose parsing runs for minutes
+without waiting on I/O. Host, port and SSL settings are read from the same
+environment variables as the built-in server (see CONFIGURATION.md).
+"""
+import os
+from app_config import HOST, PORT, SSL_ENABLED, SSL_CERT_PATH, SSL_KEY_PATH
+
+bind = f"{HOST}:{PORT}"
+worker_class = "gthread"
+
+# Sessions are held in process memory by default, so every request must reach
+# the same worker process; concurrency comes from the worker's threads instead.
+# More workers can be used when sessions are shared via MI_SESSION_REDIS_URL
+workers = int(os.getenv('MI_WORKERS', '1'))
+threads = int(os.getenv('MI_THREADS', '32'))
+
+# Keep connections open between dashboard refreshes (and from a reverse proxy)
+keepalive = 5
+
+# Large log uploads are parsed within the request
+timeout = int(os.getenv('MI_WORKER_TIMEOUT', '3600'))
+
+if SSL_ENABLED:
+    certfile = SSL_CERT_PATH
+    keyfile = SSL_KEY_PATH
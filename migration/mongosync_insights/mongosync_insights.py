@@ -1,19 +1,33 @@
+import gzip
+import hashlib
 import logging
+import re
+from functools import cache
 from flask import Flask, render_template, request, make_response
+import plotly.io as pio
 from mongosync_plot_logs import upload_file
-from mongosync_plot_metadata import plotMetrics, gatherMetrics, gatherPartitionsMetrics, gatherEndpointMetrics
+from mongosync_plot_metadata import plotMetrics, gatherMetrics, gatherPartitionsMetrics, gatherEndpointMetrics, gatherEndpointDetails, build_figure_skeletons
 from pymongo.errors import InvalidURI, PyMongoError
-from pymongo.uri_parser import parse_uri 
 from app_config import (
     setup_logging, validate_config, get_app_info, HOST, PORT, MAX_FILE_SIZE, 
-    REFRESH_TIME, APP_VERSION, validate_connection, clear_connection_cache, 
-    SECURE_COOKIES, CONNECTION_STRING, get_mongo_client,
+    REFRESH_TIME, APP_VERSION, validate_connection, 
+    SECURE_COOKIES, CONNECTION_STRING, get_mongo_client, get_cached_result,
     PROGRESS_ENDPOINT_URL, validate_progress_endpoint_url, session_store, SESSION_TIMEOUT
 )
 from connection_validator import sanitize_for_display
 
 # Cookie name for session ID
 SESSION_COOKIE_NAME = 'mi_session_id'
+SESSION_COOKIE_PATTERN = re.compile(rf'(?:^|;)\s*{re.escape(SESSION_COOKIE_NAME)}=([^;]*)')
+
+# Serialize plots with orjson (a core requirement); plotly's default "auto"
+# engine would otherwise fall back to the much slower json module unnoticed
+pio.json.config.default_engine = 'orjson'
+
+# Plot responses (dashboard JSON and the log upload results page) at least this
+# large are gzip-compressed for clients that accept it
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 6
 
 # Validate configuration on startup
 try:
@@ -25,44 +39,49 @@ except (PermissionError, ValueError) as e:
 # Setup logging
 logger = setup_logging()
 
+# Build the dashboard figure layouts once per process
+build_figure_skeletons()
+
 # Create a Flask app
 app = Flask(__name__, static_folder='images', static_url_path='/images')
 
 # Configure Flask for file uploads
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
-# Add security headers to all responses
-@app.after_request
-def add_security_headers(response):
-    """Add security headers to all HTTP responses."""
+# Content Security Policy - configured to work with Plotly charts
+# Note: Plotly requires 'unsafe-inline' and 'unsafe-eval' for rendering
+# Note: blob: is required for Plotly snapshot/download functionality
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.plot.ly; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: blob: https:; "
+    "font-src 'self' data:; "
+    "connect-src 'self' blob:;"
+)
+
+# Security headers added to every response, assembled once at import
+SECURITY_HEADERS = (
     # Enforce HTTPS and prevent downgrade attacks
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    
+    ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains'),
     # Prevent MIME type sniffing
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    
+    ('X-Content-Type-Options', 'nosniff'),
     # Prevent clickjacking attacks
-    response.headers['X-Frame-Options'] = 'DENY'
-    
+    ('X-Frame-Options', 'DENY'),
     # Control referrer information
-    response.headers['Referrer-Policy'] = 'no-referrer'
-    
-    # Content Security Policy - configured to work with Plotly charts
-    # Note: Plotly requires 'unsafe-inline' and 'unsafe-eval' for rendering
-    # Note: blob: is required for Plotly snapshot/download functionality
-    response.headers['Content-Security-Policy'] = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.plot.ly; "
-        "style-src 'self' 'unsafe-inline'; "
-        "img-src 'self' data: blob: https:; "
-        "font-src 'self' data:; "
-        "connect-src 'self' blob:;"
-    )
-    
+    ('Referrer-Policy', 'no-referrer'),
+    # Restrict content sources
+    ('Content-Security-Policy', CONTENT_SECURITY_POLICY),
     # Additional security headers
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
-    
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Permissions-Policy', 'geolocation=(), microphone=(), camera=()'),
+)
+
+# Add security headers to all responses
+@app.after_request
+def add_security_headers(response):
+    """Add security headers to all HTTP responses."""
+    response.headers.extend(SECURITY_HEADERS)
     return response
 
 # Make app version available to all templates
@@ -70,16 +89,17 @@ def add_security_headers(response):
 def inject_app_version():
     return dict(app_version=APP_VERSION)
 
-# Handle file too large error
-@app.errorhandler(413)
-def too_large(e):
+# The home and file-too-large pages depend only on settings fixed at startup,
+# so each is rendered on first use and then served from memory
+@cache
+def render_too_large_page():
     max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
     return render_template('error.html',
                          error_title="File Too Large",
-                         error_message=f"File size exceeds maximum allowed size ({max_size_mb:.1f} MB)."), 413
+                         error_message=f"File size exceeds maximum allowed size ({max_size_mb:.1f} MB).")
 
-@app.route('/')
-def home_page(): 
+@cache
+def render_home_page():
     # Calculate max file size in GB for display
     max_file_size_gb = MAX_FILE_SIZE / (1024 * 1024 * 1024)
     
@@ -104,10 +124,37 @@ def home_page():
                            progress_endpoint_form=progress_endpoint_form,
                            max_file_size_gb=max_file_size_gb)
 
+# Handle file too large error
+@app.errorhandler(413)
+def too_large(e):
+    return render_too_large_page(), 413
+
+# MongoDB errors while refreshing the dashboard (e.g. during an election) fail
+# only that request; the worker and its pooled clients stay up for the next refresh
+@app.errorhandler(PyMongoError)
+def mongo_unavailable(e):
+    logger.error(f"MongoDB error while gathering dashboard data: {e}")
+    return ({"error": "MongoDB is temporarily unavailable. The dashboard will retry on the next refresh."},
+            503, {'Retry-After': str(REFRESH_TIME)})
+
+@app.route('/')
+def home_page():
+    response = make_response(render_home_page())
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
 
 @app.route('/upload', methods=['POST'])
 def uploadLogs():
-    return upload_file()
+    # The results page embeds the whole plot JSON, typically several MB of
+    # highly repetitive text, so it is worth compressing
+    page = upload_file()
+    body = page.encode()
+    if len(body) < COMPRESS_MIN_SIZE or not request.accept_encodings['gzip']:
+        return page
+    response = app.response_class(gzip.compress(body, compresslevel=COMPRESS_LEVEL), mimetype='text/html')
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/renderMetrics', methods=['POST'])
 def renderMetrics():
@@ -115,17 +162,13 @@ def renderMetrics():
     if CONNECTION_STRING:
         TARGET_MONGO_URI = CONNECTION_STRING
     else:
-        TARGET_MONGO_URI = request.form.get('connectionString')
-        if TARGET_MONGO_URI:
-            TARGET_MONGO_URI = TARGET_MONGO_URI.strip() if TARGET_MONGO_URI.strip() else None
+        TARGET_MONGO_URI = (request.form.get('connectionString') or '').strip() or None
 
     # Get progress endpoint URL from env var or form (no caching)
     if PROGRESS_ENDPOINT_URL:
         progress_url = PROGRESS_ENDPOINT_URL
     else:
-        progress_url = request.form.get('progressEndpointUrl')
-        if progress_url:
-            progress_url = progress_url.strip() if progress_url.strip() else None
+        progress_url = (request.form.get('progressEndpointUrl') or '').strip() or None
 
     # Validate that at least one field is provided
     if not TARGET_MONGO_URI and not progress_url:
@@ -149,25 +192,24 @@ def renderMetrics():
             validate_connection(TARGET_MONGO_URI)
                 
         except InvalidURI as e:
-            clear_connection_cache()
             logger.error(f"Invalid connection string format: {e}")
             return render_template('error.html',
                                 error_title="Invalid Connection String",
                                 error_message="The connection string format is invalid. Please check your MongoDB connection string and try again.")
         except PyMongoError as e:
-            clear_connection_cache()
             logger.error(f"Failed to connect: {e}")
             return render_template('error.html',
                                 error_title="Connection Failed",
                                 error_message="Could not connect to MongoDB. Please verify your credentials, network connectivity, and that the cluster is accessible.")
         except Exception as e:
-            clear_connection_cache()
             logger.error(f"Unexpected error during connection validation: {e}")
             return render_template('error.html',
                                 error_title="Connection Error",
                                 error_message="An unexpected error occurred. Please try again.")
 
-    # Store credentials in server-side in-memory session store
+    # Store credentials in server-side session store. The URI was
+    # parsed and validated above; refreshes look up the cached client by this
+    # string and never parse it (or resolve SRV records) again
     session_data = {
         'connection_string': TARGET_MONGO_URI,
         'endpoint_url': progress_url
@@ -196,53 +238,109 @@ def renderMetrics():
     
     return response
 
+def get_session_id():
+    """Get the session ID cookie without parsing the other cookies of the request."""
+    match = SESSION_COOKIE_PATTERN.search(request.environ.get('HTTP_COOKIE', ''))
+    return match.group(1).strip() if match else None
+
+def encode_json_body(plot_json):
+    """
+    Encode a plot JSON string for sending.
+    
+    Returns:
+        tuple: (body, gzip-compressed body or None if too small to benefit, ETag of the body)
+    """
+    body = plot_json.encode()
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return body, None, etag
+    return body, gzip.compress(body, compresslevel=COMPRESS_LEVEL), etag
+
+def cached_json_response(key, compute):
+    """
+    Serve a cached plot JSON string, computing it if needed, as an application/json response.
+    
+    The body is encoded and compressed once per cache entry, and the
+    compressed copy is sent to clients that accept gzip. The dashboard sends
+    the ETag of the plot it shows in If-None-Match (these are POST requests,
+    so browsers don't do it themselves); an unchanged plot gets 304 Not
+    Modified without a body. An expired plot is still served while a newer
+    one is built in the background (see RESULT_STALE_GRACE).
+    """
+    body, gzipped, etag = get_cached_result(key, lambda: encode_json_body(compute()), serve_stale=True)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    elif gzipped is not None and request.accept_encodings['gzip']:
+        response = app.response_class(gzipped, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    # Weak, as the same ETag is sent for the gzip and identity encodings
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/get_metrics_data', methods=['POST'])
 def getMetrics():
-    # Get connection string from env var or in-memory session store
+    # Get connection string from env var or server-side session store
     if CONNECTION_STRING:
         connection_string = CONNECTION_STRING
     else:
-        session_id = request.cookies.get(SESSION_COOKIE_NAME)
-        session_data = session_store.get_session(session_id)
+        session_data = session_store.get_session(get_session_id())
         connection_string = session_data.get('connection_string')
     
     if not connection_string:
         logger.error("No connection string available for metrics refresh")
         return {"error": "No connection string available. Please refresh the page and re-enter your credentials."}, 400
     
-    return gatherMetrics(connection_string)
+    # Browsers watching the same cluster share one query per refresh interval
+    return cached_json_response(('metrics', connection_string),
+                                lambda: gatherMetrics(get_mongo_client(connection_string)))
 
 @app.route('/get_partitions_data', methods=['POST'])
 def getPartitionsData():
-    # Get connection string from env var or in-memory session store
+    # Get connection string from env var or server-side session store
     if CONNECTION_STRING:
         connection_string = CONNECTION_STRING
     else:
-        session_id = request.cookies.get(SESSION_COOKIE_NAME)
-        session_data = session_store.get_session(session_id)
+        session_data = session_store.get_session(get_session_id())
         connection_string = session_data.get('connection_string')
     
     if not connection_string:
         logger.error("No connection string available for partitions data refresh")
         return {"error": "No connection string available. Please refresh the page and re-enter your credentials."}, 400
     
-    return gatherPartitionsMetrics(connection_string)
+    return cached_json_response(('partitions', connection_string),
+                                lambda: gatherPartitionsMetrics(get_mongo_client(connection_string)))
+
+def get_endpoint_url():
+    """Get the progress endpoint URL from env var or server-side session store."""
+    if PROGRESS_ENDPOINT_URL:
+        return PROGRESS_ENDPOINT_URL
+    session_data = session_store.get_session(get_session_id())
+    return session_data.get('endpoint_url')
 
 @app.route('/get_endpoint_data', methods=['POST'])
 def getEndpointData():
-    # Get endpoint URL from env var or in-memory session store
-    if PROGRESS_ENDPOINT_URL:
-        endpoint_url = PROGRESS_ENDPOINT_URL
-    else:
-        session_id = request.cookies.get(SESSION_COOKIE_NAME)
-        session_data = session_store.get_session(session_id)
-        endpoint_url = session_data.get('endpoint_url')
-    
+    endpoint_url = get_endpoint_url()
     if not endpoint_url:
         logger.error("No progress endpoint URL available for endpoint data refresh")
         return {"error": "No progress endpoint URL available. Please refresh the page and re-enter your credentials."}, 400
     
-    return gatherEndpointMetrics(endpoint_url)
+    return cached_json_response(('endpoint', endpoint_url),
+                                lambda: gatherEndpointMetrics(endpoint_url))
+
+@app.route('/get_endpoint_details', methods=['POST'])
+def getEndpointDetails():
+    # Requested by the dashboard once the details are scrolled into view
+    endpoint_url = get_endpoint_url()
+    if not endpoint_url:
+        logger.error("No progress endpoint URL available for endpoint details refresh")
+        return {"error": "No progress endpoint URL available. Please refresh the page and re-enter your credentials."}, 400
+    
+    return cached_json_response(('endpoint_details', endpoint_url),
+                                lambda: gatherEndpointDetails(endpoint_url))
 
 if __name__ == '__main__':
     # Log startup information
@@ -250,6 +348,7 @@ if __name__ == '__main__':
     logger.info(f"Starting {app_info['name']} v{app_info['version']}")
     logger.info(f"Log file: {app_info['log_file']}")
     logger.info(f"Server: {app_info['host']}:{app_info['port']}")
+    logger.info("Running Flask development server; for production use: gunicorn -c gunicorn.conf.py mongosync_insights:app")
     
     # Import SSL config
     from app_config import SSL_ENABLED, SSL_CERT_PATH, SSL_KEY_PATH
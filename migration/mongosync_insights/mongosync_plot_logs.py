@@ -1,19 +1,50 @@
-import plotly.graph_objects as go
-from plotly.utils import PlotlyJSONEncoder
+import plotly.io as pio
 from plotly.subplots import make_subplots
 from tqdm import tqdm
 from flask import request, render_template
+from functools import lru_cache
 import json
 from datetime import datetime, timezone
 from dateutil import parser
 import re
 import logging
-import os
 import magic
 from werkzeug.utils import secure_filename
-from mongosync_plot_utils import format_byte_size, convert_bytes
-from app_config import MAX_FILE_SIZE, ALLOWED_EXTENSIONS, ALLOWED_MIME_TYPES
-from file_decompressor import decompress_file, is_compressed_mime_type
+from mongosync_plot_utils import format_byte_size, convert_bytes, get_figure_skeleton, downsample_min_max
+from app_config import MAX_FILE_SIZE, ALLOWED_EXTENSIONS, ALLOWED_MIME_TYPES, MAX_PLOT_POINTS, is_allowed_filename
+from file_decompressor import decompress_file_stream, is_compressed_mime_type, get_file_extension
+
+@lru_cache(maxsize=8)
+def get_log_figure_skeleton(bytes_unit, has_phase_transitions):
+    """Build the static layout and trace placements of the log plot once per bytes unit and phase source."""
+    # Create a subplot for the scatter plots and a separate subplot for the table
+    fig = make_subplots(rows=8, cols=2, subplot_titles=("Mongosync Phases", "Estimated Total and Copied " + bytes_unit,
+                                                        "Lag Time (seconds)", "Change Events Applied",
+                                                        "Collection Copy - Avg and Max Read time (ms)", "Collection Copy Source Reads",
+                                                        "Collection Copy - Avg and Max Write time (ms)", "Collection Copy Destination Writes",
+                                                        "CEA Source - Avg and Max Read time (ms)", "CEA Source Reads",
+                                                        "CEA Destination - Avg and Max Write time (ms)", "CEA Destination Writes",
+                                                        "MongoSync Options", 
+                                                        "MongoSync Hidden Options",),
+                        specs=[ [{}, {}], #Mongosync Phases and Estimated Total and Copied 
+                                [{}, {}], #Lag Time and Events Applied
+                                [{}, {}], #Collection Copy Source
+                                [{}, {}], #Collection Copy Destination
+                                [{}, {}], #CEA Source
+                                [{}, {}], #CEA Destination 
+                                [{"colspan": 2, "type": "table"}, None], 
+                                [{"colspan": 2, "type": "table"}, None] ])
+    
+    if has_phase_transitions:
+        fig.update_yaxes(showticklabels=False, row=1, col=1)
+    
+    # Update layout
+    # 225 per plot
+    fig.update_layout(height=1800, width=1450, legend_tracegroupgap=170, showlegend=False,
+                      legend=dict(y=1))
+    
+    cells = [(row, col) for row in range(1, 7) for col in range(1, 3)] + [(7, 1), (8, 1)]
+    return get_figure_skeleton(fig, cells)
 
 def upload_file():
     # Use the centralized logging configuration
@@ -46,8 +77,8 @@ def upload_file():
                                  error_message="Invalid filename. Please use a valid file name.")
         
         # Check file extension
-        file_ext = os.path.splitext(filename)[1].lower()
-        if file_ext not in ALLOWED_EXTENSIONS:
+        file_ext = get_file_extension(filename)
+        if not is_allowed_filename(filename):
             logger.error(f"Invalid file extension: {file_ext}. Allowed: {ALLOWED_EXTENSIONS}")
             return render_template('error.html',
                                  error_title="Invalid File Type",
@@ -122,7 +153,7 @@ def upload_file():
         # Determine if file is compressed and get appropriate iterator
         if is_compressed_mime_type(file_mime_type):
             logger.info(f"Decompressing {file_mime_type} file before processing")
-            file_iterator = decompress_file(file, file_mime_type, filename)
+            file_iterator = decompress_file_stream(file, file_mime_type, filename)
         else:
             file_iterator = file
         
@@ -223,14 +254,16 @@ def upload_file():
             #values = [[str(item[key]).replace('{', '').replace('}', '')  for item in mongosync_hiddenflags] for key in keys]
 
             # Create a table trace with the keys as the first column and the corresponding values as the second column
-            table_hiddenflags = go.Table(
+            table_hiddenflags = dict(
+                type="table",
                 header=dict(values=['Key', 'Value'], font=dict(size=12, color='black')),
                 cells=dict(values=[keys, values],  align=['left'], font=dict(size=10, color='darkblue')), #
                 columnwidth=[0.75, 2.5]  # Adjust the column widths as needed
             )
         else:
             logging.info("mongosync_hiddenflags is empty")
-            table_hiddenflags = go.Table(
+            table_hiddenflags = dict(
+                type="table",
                 header=dict(values=['Mongosync Hidden Flags']),
                 cells=dict(values=[["No Mongosync Hidden Flags found in the log file"]])
             )
@@ -243,7 +276,8 @@ def upload_file():
             #values = [[item[key] for item in mongosync_opts_list[0]] for key in keys]
 
             # Create a table trace with the keys as the first column and the corresponding values as the second column
-            table_trace = go.Table(
+            table_trace = dict(
+                type="table",
                 header=dict(values=['Key', 'Value'], font=dict(size=12, color='black')),
                 cells=dict(values=[keys, values], align=['left'], font=dict(size=10, color='darkblue')),
                 columnwidth=[0.75, 2.5]  # Adjust the column widths as needed
@@ -258,7 +292,7 @@ def upload_file():
                     values = values[:i] + hidden_values + values[i+1:]
         else:
             logging.info("mongosync_opts_list is empty")
-            table_trace = go.Table(header=dict(values=['Mongosync Options']),
+            table_trace = dict(type="table", header=dict(values=['Mongosync Options']),
             cells=dict(values=[["No Mongosync Options found in the log file"]]))
 
         #Getting the Timezone
@@ -349,102 +383,84 @@ def upload_file():
 
         logging.info(f"Plotting")
 
-        # Create a subplot for the scatter plots and a separate subplot for the table
-        fig = make_subplots(rows=8, cols=2, subplot_titles=("Mongosync Phases", "Estimated Total and Copied " + estimated_total_bytes_unit,
-                                                            "Lag Time (seconds)", "Change Events Applied",
-                                                            "Collection Copy - Avg and Max Read time (ms)", "Collection Copy Source Reads",
-                                                            "Collection Copy - Avg and Max Write time (ms)", "Collection Copy Destination Writes",
-                                                            "CEA Source - Avg and Max Read time (ms)", "CEA Source Reads",
-                                                            "CEA Destination - Avg and Max Write time (ms)", "CEA Destination Writes",
-                                                            "MongoSync Options", 
-                                                            "MongoSync Hidden Options",),
-                            specs=[ [{}, {}], #Mongosync Phases and Estimated Total and Copied 
-                                    [{}, {}], #Lag Time and Events Applied
-                                    [{}, {}], #Collection Copy Source
-                                    [{}, {}], #Collection Copy Destination
-                                    [{}, {}], #CEA Source
-                                    [{}, {}], #CEA Destination 
-                                    [{"colspan": 2, "type": "table"}, None], 
-                                    [{"colspan": 2, "type": "table"}, None] ])
-
-        # Add traces
+        skeleton_layout, placements = get_log_figure_skeleton(estimated_total_bytes_unit, bool(phase_transitions))
+
+        # Traces are plain dicts placed into the cached skeleton; going through
+        # fig.add_traces would validate (and copy) every data array of the log
+        traces = []
+        def add(trace, row, col):
+            # Long time series are reduced to what the subplot can show
+            if trace.get("mode") == 'lines':
+                trace["x"], trace["y"] = downsample_min_max(trace["x"], trace["y"], MAX_PLOT_POINTS)
+            traces.append(dict(trace, **placements[(row, col)]))
 
         # Mongosync Phases
         if phase_transitions:
-            fig.add_trace(go.Scatter(x=ts_t_list_formatted, y=phase_list, mode='markers+text',marker=dict(color='green')), row=1, col=1)
-            fig.update_yaxes(showticklabels=False, row=1, col=1)  
+            add(dict(type="scatter", x=ts_t_list_formatted, y=phase_list, mode='markers+text',marker=dict(color='green')), 1, 1)
         else:
-            fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', name='Mongosync Phases',textfont=dict(size=30, color="black")), row=1, col=1)
+            add(dict(type="scatter", x=[0], y=[0], text="NO DATA", mode='text', name='Mongosync Phases',textfont=dict(size=30, color="black")), 1, 1)
 #            fig.update_layout(xaxis5=dict(showgrid=False, zeroline=False, showticklabels=False), 
 #                            yaxis5=dict(showgrid=False, zeroline=False, showticklabels=False))
 
         # Estimated Total and Copied
         if estimated_total_bytes > 0 or estimated_copied_bytes > 0:
         #fig = go.Figure(data=[go.Bar(name='Estimated Total Bytes', x=['Bytes'], y=[estimated_total_bytes], row=1, col=1), go.Bar(name='Estimated Copied Bytes', x=['Bytes'], y=[estimated_copied_bytes])], row=1, col=1)
-            fig.add_trace( go.Bar( name='Estimated ' + estimated_total_bytes_unit + ' to be Copied',  x=[estimated_total_bytes_unit],  y=[estimated_total_bytes], legendgroup="groupTotalCopied" ), row=1, col=2)
-            fig.add_trace( go.Bar( name='Estimated Copied ' + estimated_total_bytes_unit, x=[estimated_total_bytes_unit],  y=[estimated_copied_bytes], legendgroup="groupTotalCopied"), row=1, col=2)
+            add(dict(type="bar", name='Estimated ' + estimated_total_bytes_unit + ' to be Copied',  x=[estimated_total_bytes_unit],  y=[estimated_total_bytes], legendgroup="groupTotalCopied" ), 1, 2)
+            add(dict(type="bar", name='Estimated Copied ' + estimated_total_bytes_unit, x=[estimated_total_bytes_unit],  y=[estimated_copied_bytes], legendgroup="groupTotalCopied"), 1, 2)
         else:
-            fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', name='Estimated Total and Copied',textfont=dict(size=30, color="black")), row=1, col=2)
+            add(dict(type="scatter", x=[0], y=[0], text="NO DATA", mode='text', name='Estimated Total and Copied',textfont=dict(size=30, color="black")), 1, 2)
 
         # Lag Time
-        fig.add_trace(go.Scatter(x=times, y=lagTimeSeconds, mode='lines', name='Seconds', legendgroup="groupEventsAndLags"), row=2, col=1)
+        add(dict(type="scatter", x=times, y=lagTimeSeconds, mode='lines', name='Seconds', legendgroup="groupEventsAndLags"), 2, 1)
         #fig.update_yaxes(title_text="Lag Time (seconds)", row=2, col=1)
 
         # Total Events Applied
-        fig.add_trace(go.Scatter(x=times, y=totalEventsApplied, mode='lines', name='Events', legendgroup="groupEventsAndLags"), row=2, col=2)
+        add(dict(type="scatter", x=times, y=totalEventsApplied, mode='lines', name='Events', legendgroup="groupEventsAndLags"), 2, 2)
         #fig.update_yaxes(title_text="Change Events Applied", row=2, col=2)
 
         # Collection Copy Source Read
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopySourceRead, mode='lines', name='Average time (ms)', legendgroup="groupCCSourceRead"), row=3, col=1)
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopySourceRead_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCCSourceRead"), row=3, col=1)
+        add(dict(type="scatter", x=times, y=CollectionCopySourceRead, mode='lines', name='Average time (ms)', legendgroup="groupCCSourceRead"), 3, 1)
+        add(dict(type="scatter", x=times, y=CollectionCopySourceRead_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCCSourceRead"), 3, 1)
         #fig.update_yaxes(title_text="Avg and Max time (ms)", secondary_y=False, row=3, col=1)
 
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopySourceRead_numOperations, mode='lines', name='Reads', legendgroup="groupCCSourceRead"), row=3, col=2)
+        add(dict(type="scatter", x=times, y=CollectionCopySourceRead_numOperations, mode='lines', name='Reads', legendgroup="groupCCSourceRead"), 3, 2)
         #fig.update_yaxes(title_text="Number of Reads", secondary_y=True, row=3, col=2)
 
         #Collection Copy Destination
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopyDestinationWrite, mode='lines', name='Average time (ms)', legendgroup="groupCCDestinationWrite"), row=4, col=1)
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopyDestinationWrite_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCCDestinationWrite"), row=4, col=1)
+        add(dict(type="scatter", x=times, y=CollectionCopyDestinationWrite, mode='lines', name='Average time (ms)', legendgroup="groupCCDestinationWrite"), 4, 1)
+        add(dict(type="scatter", x=times, y=CollectionCopyDestinationWrite_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCCDestinationWrite"), 4, 1)
         #fig.update_yaxes(title_text="Avg and Max time (ms)", secondary_y=False, row=4, col=1)
 
-        fig.add_trace(go.Scatter(x=times, y=CollectionCopyDestinationWrite_numOperations, mode='lines', name='Writes', legendgroup="groupCCDestinationWrite"), row=4, col=2,)
+        add(dict(type="scatter", x=times, y=CollectionCopyDestinationWrite_numOperations, mode='lines', name='Writes', legendgroup="groupCCDestinationWrite"), 4, 2)
         #fig.update_yaxes(title_text="Number of Writes", secondary_y=True, row=4, col=2)
 
         #CEA Source
-        fig.add_trace(go.Scatter(x=times, y=CEASourceRead, mode='lines', name='Average time (ms)', legendgroup="groupCEASourceRead"), row=5, col=1)
-        fig.add_trace(go.Scatter(x=times, y=CEASourceRead_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCEASourceRead"), row=5, col=1)
+        add(dict(type="scatter", x=times, y=CEASourceRead, mode='lines', name='Average time (ms)', legendgroup="groupCEASourceRead"), 5, 1)
+        add(dict(type="scatter", x=times, y=CEASourceRead_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCEASourceRead"), 5, 1)
         #fig.update_yaxes(title_text="Avg and Max time (ms)", secondary_y=False, row=5, col=1)
 
-        fig.add_trace(go.Scatter(x=times, y=CEASourceRead_numOperations, mode='lines', name='Reads', legendgroup="groupCEASourceRead"), row=5, col=2)
+        add(dict(type="scatter", x=times, y=CEASourceRead_numOperations, mode='lines', name='Reads', legendgroup="groupCEASourceRead"), 5, 2)
         #fig.update_yaxes(title_text="Number of Reads", secondary_y=True, row=5, col=2)
 
         #CEA Destination
-        fig.add_trace(go.Scatter(x=times, y=CEADestinationWrite, mode='lines', name='Average time (ms)', legendgroup="groupCEADestinationWrite"), row=6, col=1)
-        fig.add_trace(go.Scatter(x=times, y=CEADestinationWrite_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCEADestinationWrite"), row=6, col=1)
+        add(dict(type="scatter", x=times, y=CEADestinationWrite, mode='lines', name='Average time (ms)', legendgroup="groupCEADestinationWrite"), 6, 1)
+        add(dict(type="scatter", x=times, y=CEADestinationWrite_maximum, mode='lines', name='Maximum time (ms)', legendgroup="groupCEADestinationWrite"), 6, 1)
         #fig.update_yaxes(title_text="Avg and Max time (ms)", secondary_y=False, row=6, col=1)
 
-        fig.add_trace(go.Scatter(x=times, y=CEADestinationWrite_numOperations, mode='lines', name='Writes during CEA', legendgroup="groupCEADestinationWrite"), row=6, col=2)
+        add(dict(type="scatter", x=times, y=CEADestinationWrite_numOperations, mode='lines', name='Writes during CEA', legendgroup="groupCEADestinationWrite"), 6, 2)
         #fig.update_yaxes(title_text="Number of Writes", secondary_y=True, row=6, col=2)
 
         #Add the Mongosync options
-        fig.add_trace(table_trace, row=7, col=1)
+        add(table_trace, 7, 1)
 
         #Add the Mongosync options
-        fig.add_trace(table_hiddenflags, row=8, col=1)
+        add(table_hiddenflags, 8, 1)
 
-        # Update layout
-        # 225 per plot
-        fig.update_layout(height=1800, width=1450, title_text="Mongosync Replication Progress - " + version_text + " - Timezone info: " + timeZoneInfo, legend_tracegroupgap=170, showlegend=False)
-
-
-        fig.update_layout(
-            legend=dict(
-                y=1
-            )
-        )
+        # Only the title changes per log file
+        layout = dict(skeleton_layout, title={"text": "Mongosync Replication Progress - " + version_text + " - Timezone info: " + timeZoneInfo})
 
-        # Convert the figure to JSON
-        plot_json = json.dumps(fig, cls=PlotlyJSONEncoder)
+        # Convert the figure to JSON (uses orjson when installed, which also encodes the datetime axes)
+        plot_json = pio.json.to_json_plotly({"data": traces, "layout": layout})
 
         logging.info(f"Render the plot in the browse")
 
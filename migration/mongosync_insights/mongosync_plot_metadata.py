@@ -1,51 +1,226 @@
 import plotly.graph_objects as go
-from plotly.utils import PlotlyJSONEncoder
+import plotly.io as pio
 from plotly.subplots import make_subplots
 from flask import request, render_template
 import json
 import logging
+import orjson
+import re
+import threading
+from functools import lru_cache
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 from bson import Timestamp
-from pymongo.errors import PyMongoError
-from mongosync_plot_utils import format_byte_size, convert_bytes
+from mongosync_plot_utils import format_byte_size, convert_bytes, get_figure_skeleton
 
+# Progress endpoint requests reuse keep-alive connections across refreshes;
+# (connect, read) timeouts keep an unreachable endpoint from holding a worker.
+# Only connection failures are retried: retrying read timeouts would stretch a
+# hung endpoint's request well past the refresh interval
+ENDPOINT_TIMEOUT = (2, 5)
+endpoint_session = requests.Session()
+endpoint_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                              max_retries=Retry(total=2, read=0, backoff_factor=0.1)))
 
-def get_phase_timestamp(phase_transitions, phase_name):
-    """Find the first matching phase and return its timestamp as datetime."""
-    if not phase_transitions:
-        return None
-    for pt in phase_transitions:
-        if pt.get("phase") == phase_name:
-            ts = pt.get("ts")
-            if isinstance(ts, Timestamp):
-                return datetime.fromtimestamp(ts.time, tz=timezone.utc)
-            elif isinstance(ts, datetime):
-                return ts
-    return None
+# Runs a view's independent MongoDB reads alongside the request thread so their
+# round trips overlap (pymongo clients are thread-safe)
+query_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mi-query")
 
-def gatherMetrics(connection_string):
-    # Use the centralized logging and configuration
-    logger = logging.getLogger(__name__)
+# Last plot of each endpoint view figure built per progress endpoint, with the
+# response body it was built from. The endpoint often returns the same body on
+# consecutive refreshes (e.g. while paused or after commit), which is then not
+# plotted again
+ENDPOINT_PLOT_CACHE_SIZE = 32
+endpoint_plot_cache = {}
+endpoint_plot_cache_lock = threading.Lock()
+
+
+def get_phase_timestamps(phase_transitions, phase_names):
+    """
+    Find the first transition of each phase in a single pass over the transitions.
     
-    # Import and use the centralized configuration
-    from app_config import INTERNAL_DB_NAME, get_database
+    Args:
+        phase_transitions: phaseTransitions list from the coordinator resumeData
+        phase_names: Names of the phases to look for
+        
+    Returns:
+        dict: {phase name: datetime or None}
+    """
+    found = dict.fromkeys(phase_names)
+    pending = set(phase_names)
+    for pt in phase_transitions or ():
+        phase = pt.get("phase")
+        if phase not in pending:
+            continue
+        ts = pt.get("ts")
+        if isinstance(ts, Timestamp):
+            found[phase] = datetime.fromtimestamp(ts.time, timezone.utc)
+        elif isinstance(ts, datetime):
+            found[phase] = ts
+        else:
+            # Keep looking for a later transition of this phase with a usable timestamp
+            continue
+        pending.discard(phase)
+        if not pending:
+            break
+    return found
+
+# Fields read from the coordinator resumeData and globalState documents; the
+# rest (resume tokens, per-collection state) can be large and is not needed.
+# lastEventTs is the most recent of the CRUD and DDL change stream events
+# ($max skips a missing one)
+RESUME_DATA_PROJECTION = {
+    "state": 1,
+    "syncPhase": 1,
+    "lastEventTs": {"$max": ["$crudChangeStreamResumeInfo.lastEventTs", "$ddlChangeStreamResumeInfo.lastEventTs"]},
+    "phaseTransitions": 1
+}
+GLOBAL_STATE_PROJECTION = {
+    "reversible": 1,
+    "writeBlockingMode": 1,
+    "buildIndexes": 1,
+    "detectRandomId": 1,
+    "verificationmode": 1,
+    "namespaceFilter": 1
+}
+
+def merge_layout(base, updates):
+    """Copy a skeleton layout, merging per-request updates into its top-level entries (e.g. axes)."""
+    layout = dict(base)
+    for key, value in updates.items():
+        layout[key] = {**base.get(key, {}), **value} if isinstance(value, dict) else value
+    return layout
+
+@lru_cache(maxsize=None)
+def get_colorscale(name):
+    """Resolve a named plotly colorscale to the explicit list plotly.js expects."""
+    return [list(step) for step in go.bar.Marker(colorscale=name).colorscale]
+
+@lru_cache(maxsize=None)
+def get_text_font(size, color):
+    """Get the shared font dict of the given size and color; traces reference it without modifying it."""
+    return dict(size=size, color=color)
+
+def get_status_documents(internal_db):
+    """
+    Fetch the coordinator resumeData document and the globalState document in one round trip.
     
-    TARGET_MONGO_URI = connection_string
-    internalDb = INTERNAL_DB_NAME
+    Args:
+        internal_db: mongosync internal database on the destination cluster
+        
+    Returns:
+        tuple: (resumeData document, globalState document); either may be None
+    """
+    pipeline = [
+        {"$match": {"_id": "coordinator"}},
+        {"$project": RESUME_DATA_PROJECTION},
+        {"$set": {"_source": "resumeData"}},
+        {"$unionWith": {"coll": "globalState", "pipeline": [
+            {"$limit": 1},
+            {"$project": GLOBAL_STATE_PROJECTION},
+            {"$set": {"_source": "globalState"}}
+        ]}}
+    ]
+    docs = {doc.pop("_source"): doc for doc in internal_db.resumeData.aggregate(pipeline)}
+    return docs.get("resumeData"), docs.get("globalState")
+
+# Display values for mongosync states and globalState options
+STATE_COLORS = {"RUNNING": "blue", "IDLE": "yellow", "PAUSED": "red", "COMMITTED": "green"}
+ENDPOINT_STATE_COLORS = {"RUNNING": "blue", "IDLE": "orange", "COMMITTED": "green", "PAUSED": "red"}
+
+# Styling shared by the endpoint view tables; traces reference these dicts
+# without modifying them
+KEY_VALUE_TABLE_HEADER = dict(values=["Key", "Value"], font=get_text_font(12, 'black'))
+VERIFICATION_TABLE_HEADER = dict(values=["Field", "Source", "Destination"], font=get_text_font(12, 'black'))
+TABLE_CELL_STYLE = dict(align=['left'], font=get_text_font(10, 'darkblue'))
+KEY_VALUE_TABLE_COLUMN_WIDTH = [0.75, 2.5]
+VERIFICATION_TABLE_COLUMN_WIDTH = [1.5, 1, 1]
+# Verifier fields compared between source and destination, as (key, label)
+VERIFICATION_FIELDS = (
+    ("phase", "Phase"),
+    ("lagTimeSeconds", "Lag Time Seconds"),
+    ("totalCollectionCount", "Total Collection Count"),
+    ("scannedCollectionCount", "Scanned Collection Count"),
+    ("hashedDocumentCount", "Hashed Document Count"),
+    ("estimatedDocumentCount", "Estimated Document Count")
+)
+VERIFICATION_FIELD_LABELS = [label for _, label in VERIFICATION_FIELDS]
+# Splits long table values into lines of up to 30 characters
+TABLE_VALUE_WRAP_PATTERN = re.compile(r'.{1,30}', re.DOTALL)
+
+def error_text_trace(text, size=20):
+    """Build a text trace showing an error message in red."""
+    return dict(type="scatter", x=[0], y=[0], text=[text], mode='text', textfont=get_text_font(size, "red"))
+
+# Style of the done vs remaining pies of the endpoint view, shared by reference
+PROGRESS_PIE_STYLE = dict(
+    marker=dict(colors=["green", "lightgray"]),
+    textinfo="percent",
+    textposition="outside",
+    textfont=dict(size=12),
+    hole=0.3,
+    showlegend=True
+)
+
+# Placeholder trace of the endpoint view pies, built once; add() copies a trace
+# before placing it, so it is never modified
+NO_DATA_PIE = dict(
+    type="pie",
+    labels=["No Data"],
+    values=[1],
+    marker=dict(colors=["lightgray"]),
+    textinfo="label",
+    textfont=dict(size=14),
+    showlegend=False
+)
+WRITE_BLOCKING_MODE_LABELS = {
+    "destinationOnly": "Destination Only",
+    "sourceAndDestination": "Source and Destination",
+    "none": "None"
+}
+BUILD_INDEXES_LABELS = {
+    "afterDataCopy": "After Data Copy",
+    "beforeDataCopy": "Before Data Copy",
+    "never": "Never"
+}
+
+# Text panels of the status view as (trace name, row, col), in trace order
+STATUS_TEXT_PANELS = (
+    ('Mongosync State', 1, 1),
+    ('Mongosync Phase', 1, 2),
+    ('Lag Time', 1, 3),
+    ('Mongosync Start', 1, 4),
+    ('Mongosync Finish', 1, 5),
+    ('Reversible', 2, 1),
+    ('Write Blocking Mode', 2, 2),
+    ('Build Indexes', 2, 3),
+    ('Detect Random Id', 2, 4),
+    ('Embedded Verifier', 2, 5),
+)
+
+@lru_cache(maxsize=64)
+def wrap_phase_label(phase):
+    """Wrap a sync phase name for its status panel; mongosync has only a handful of phases."""
+    return "<br>".join(textwrap.wrap(phase, width=15))
+
+@lru_cache(maxsize=1)
+def get_status_figure_skeleton():
+    """
+    Build the static part of the status view once, as plain JSON-ready dicts.
     
-    # Connect to MongoDB cluster using connection pooling
-    try:
-        internalDbDst = get_database(TARGET_MONGO_URI, internalDb)
-        logger.info("Connected to target MongoDB cluster using connection pooling.")
-    except PyMongoError as e:
-        logger.error(f"Failed to connect to target MongoDB: {e}")
-        exit(1)
-    # Create a subplot for status information (3 rows)
-    fig = make_subplots(rows=3, 
+    Returns:
+        tuple: (placeholder traces, layout); one text panel trace per entry of
+        STATUS_TEXT_PANELS, in the same order. Treat both as read-only.
+    """
+    # Create a subplot for status information (2 rows); the namespace filters
+    # are sent alongside the figure and rendered as HTML tables by the page
+    fig = make_subplots(rows=2, 
                         cols=5, 
-                        row_heights=[0.35, 0.35, 0.30],
+                        row_heights=[0.5, 0.5],
                         subplot_titles=("Current State", 
                                         "Current Phase",
                                         "Lag Time",
@@ -56,43 +231,50 @@ def gatherMetrics(connection_string):
                                         "Write Blocking Mode",
                                         "Build Indexes",
                                         "Detect Random Id",
-                                        "Embedded Verifier",
-                                        
-                                        "Namespace Filter - Inclusion",
-                                        "Namespace Filter - Exclusion"),
-                        specs=[[{}, {}, {}, {}, {}],
-                               [{}, {}, {}, {}, {}],
-                               [{"type": "table", "colspan": 2}, None, None, {"type": "table", "colspan": 2}, None]]                           
+                                        "Embedded Verifier")
                         )
+    
+    traces = [go.Scatter(x=[0], y=[0], mode='text', name=name, textfont=dict(size=17, color="black"))
+              for name, _, _ in STATUS_TEXT_PANELS]
+    rows = [row for _, row, _ in STATUS_TEXT_PANELS]
+    cols = [col for _, _, col in STATUS_TEXT_PANELS]
+    fig.add_traces(traces, rows=rows, cols=cols)
+    
+    # Hide the axes of the text panels and update layout
+    fig.update_xaxes(showgrid=False, zeroline=False, showticklabels=False)
+    fig.update_yaxes(showgrid=False, zeroline=False, showticklabels=False)
+    fig.update_layout(height=450, width=1550, autosize=True, title_text="Mongosync Status - Timezone info: UTC", showlegend=False, plot_bgcolor="white")
+    
+    fig_dict = json.loads(pio.to_json(fig, validate=False))
+    return fig_dict['data'], fig_dict['layout']
+
+def gatherMetrics(client):
+    """Generate status view for the destination cluster using a cached, pooled MongoClient."""
+    # Import and use the centralized configuration
+    from app_config import INTERNAL_DB_NAME
+    
+    internalDbDst = client[INTERNAL_DB_NAME]
+    
+    # Text shown in each STATUS_TEXT_PANELS panel, as (text, color)
+    panels = []
 
-    #Get State and Phase from resumeData collection
-    vResumeData = internalDbDst.resumeData.find_one({"_id": "coordinator"})
+    #Get State and Phase from resumeData, and the migration options from globalState
+    vResumeData, vGlobalState = get_status_documents(internalDbDst)
 
     #Plot mongosync State
     vState = vResumeData["state"]
-    if vState == 'RUNNING':
-        vColor = 'blue'
-    elif vState == "IDLE":
-        vColor = "yellow"
-    elif vState == "PAUSED":
-        vColor = "red"
-    elif vState == "COMMITTED":
-        vColor = "green"
-    else:
+    vColor = STATE_COLORS.get(vState)
+    if vColor is None:
         logging.warning(vState + " is not listed as an option")
         vColor = "gray"
     
     #Plot Mongosync State
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[str(vState)], mode='text', name='Mongosync State',textfont=dict(size=17, color=vColor)), row=1, col=1)
-    fig.update_layout(xaxis1=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis1=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((str(vState), vColor))
 
     #Plot Mongosync Phase
     vPhase = vResumeData["syncPhase"].capitalize()
-    wrapped_phase = "<br>".join(textwrap.wrap(str(vPhase), width=15))
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[wrapped_phase], mode='text', name='Mongosync Phase',textfont=dict(size=17, color="black")), row=1, col=2)
-    fig.update_layout(xaxis2=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis2=dict(showgrid=False, zeroline=False, showticklabels=False))
+    wrapped_phase = wrap_phase_label(str(vPhase))
+    panels.append((wrapped_phase, "black"))
 
     #Plot Lag Time (calculated from crudChangeStreamResumeInfo.lastEventTs)
     def format_lag_duration(delta):
@@ -113,115 +295,67 @@ def gatherMetrics(connection_string):
         parts.append(f"{seconds}s")
         return " ".join(parts)
 
-    def get_last_event_datetime(resume_info):
-        """Extract lastEventTs from resume info and convert to datetime."""
-        if not resume_info:
-            return None
-        lastEventTs = resume_info.get("lastEventTs")
-        if not lastEventTs:
-            return None
+    def get_last_event_datetime(lastEventTs):
+        """Convert the lastEventTs of the most recent change stream event to datetime."""
         if isinstance(lastEventTs, Timestamp):
-            return datetime.fromtimestamp(lastEventTs.time, tz=timezone.utc)
+            return datetime.fromtimestamp(lastEventTs.time, timezone.utc)
         elif isinstance(lastEventTs, datetime):
             return lastEventTs if lastEventTs.tzinfo else lastEventTs.replace(tzinfo=timezone.utc)
         return None
 
     lagTimeText = 'NO DATA'
-    crudChangeStreamResumeInfo = vResumeData.get("crudChangeStreamResumeInfo") if vResumeData else None
-    ddlChangeStreamResumeInfo = vResumeData.get("ddlChangeStreamResumeInfo") if vResumeData else None
-    
-    crudLastEventDt = get_last_event_datetime(crudChangeStreamResumeInfo)
-    ddlLastEventDt = get_last_event_datetime(ddlChangeStreamResumeInfo)
-    
-    # Use the most recent timestamp between crud and ddl
-    lastEventDt = None
-    if crudLastEventDt and ddlLastEventDt:
-        lastEventDt = max(crudLastEventDt, ddlLastEventDt)
-    elif crudLastEventDt:
-        lastEventDt = crudLastEventDt
-    elif ddlLastEventDt:
-        lastEventDt = ddlLastEventDt
+    # The most recent of the crud and ddl timestamps, computed by the status query
+    lastEventDt = get_last_event_datetime(vResumeData.get("lastEventTs")) if vResumeData else None
     
     if lastEventDt:
         currentTime = datetime.now(tz=timezone.utc)
         lagDuration = currentTime - lastEventDt
         lagTimeText = format_lag_duration(lagDuration)
 
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[lagTimeText], mode='text', name='Lag Time',textfont=dict(size=17, color="black")), row=1, col=3)
-    fig.update_layout(xaxis3=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis3=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((lagTimeText, "black"))
 
     #Plot Mongosync Start time (using phaseTransitions from vResumeData)
     phaseTransitions = vResumeData.get("phaseTransitions", []) if vResumeData else []
-    newInitial = get_phase_timestamp(phaseTransitions, "initializing collections and indexes")
+    phaseTimestamps = get_phase_timestamps(phaseTransitions, ("initializing collections and indexes", "commit completed"))
+    newInitial = phaseTimestamps["initializing collections and indexes"]
     if newInitial is None:
         newInitialText = 'NO DATA'
     else:
         newInitialText = newInitial.strftime("%Y-%m-%d %H:%M:%S")
 
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[newInitialText], mode='text', name='Mongosync Start',textfont=dict(size=17, color="black")), row=1, col=4)
-    fig.update_layout(xaxis4=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis4=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((newInitialText, "black"))
     
     #Plot Mongosync Finish time (using phaseTransitions from vResumeData)
-    newFinish = get_phase_timestamp(phaseTransitions, "commit completed")
+    newFinish = phaseTimestamps["commit completed"]
     if newFinish is None:
         newFinishText = 'NO DATA'
     else:
         newFinishText = newFinish.strftime("%Y-%m-%d %H:%M:%S")
 
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[newFinishText], mode='text', name='Mongosync Finish',textfont=dict(size=17, color="black")), row=1, col=5)
-    fig.update_layout(xaxis5=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis5=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((newFinishText, "black"))
 
     #Plot globalState values
-    vGlobalState = internalDbDst.globalState.find_one({})
-    
     #Plot Reversible
     reversibleValue = str(vGlobalState.get("reversible", "NO DATA")) if vGlobalState else "NO DATA"
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[reversibleValue], mode='text', name='Reversible',textfont=dict(size=17, color="black")), row=2, col=1)
-    fig.update_layout(xaxis6=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis6=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((reversibleValue, "black"))
     
     #Plot Write Blocking Mode
     writeBlockingModeRaw = vGlobalState.get("writeBlockingMode") if vGlobalState else None
-    if writeBlockingModeRaw == "destinationOnly":
-        writeBlockingModeValue = "Destination Only"
-    elif writeBlockingModeRaw == "sourceAndDestination":
-        writeBlockingModeValue = "Source and Destination"
-    elif writeBlockingModeRaw == "none":
-        writeBlockingModeValue = "None"
-    else:
-        writeBlockingModeValue = "NO DATA"
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[writeBlockingModeValue], mode='text', name='Write Blocking Mode',textfont=dict(size=17, color="black")), row=2, col=2)
-    fig.update_layout(xaxis7=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis7=dict(showgrid=False, zeroline=False, showticklabels=False))
+    writeBlockingModeValue = WRITE_BLOCKING_MODE_LABELS.get(writeBlockingModeRaw, "NO DATA")
+    panels.append((writeBlockingModeValue, "black"))
     
     #Plot Build Indexes
     buildIndexesRaw = vGlobalState.get("buildIndexes") if vGlobalState else None
-    if buildIndexesRaw == "afterDataCopy":
-        buildIndexesValue = "After Data Copy"
-    elif buildIndexesRaw == "beforeDataCopy":
-        buildIndexesValue = "Before Data Copy"
-    elif buildIndexesRaw == "never":
-        buildIndexesValue = "Never"
-    else:
-        buildIndexesValue = "NO DATA"
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[buildIndexesValue], mode='text', name='Build Indexes',textfont=dict(size=17, color="black")), row=2, col=3)
-    fig.update_layout(xaxis8=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis8=dict(showgrid=False, zeroline=False, showticklabels=False))
+    buildIndexesValue = BUILD_INDEXES_LABELS.get(buildIndexesRaw, "NO DATA")
+    panels.append((buildIndexesValue, "black"))
     
     #Plot Detect Random Id
     detectRandomIdValue = str(vGlobalState.get("detectRandomId", "NO DATA")) if vGlobalState else "NO DATA"
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[detectRandomIdValue], mode='text', name='Detect Random Id',textfont=dict(size=17, color="black")), row=2, col=4)
-    fig.update_layout(xaxis9=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis9=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((detectRandomIdValue, "black"))
     
     #Plot Verification Mode
     verificationModeValue = str(vGlobalState.get("verificationmode", "NO DATA")).capitalize() if vGlobalState else "NO DATA"
-    fig.add_trace(go.Scatter(x=[0], y=[0], text=[verificationModeValue], mode='text', name='Embedded Verifier',textfont=dict(size=17, color="black")), row=2, col=5)
-    fig.update_layout(xaxis10=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                      yaxis10=dict(showgrid=False, zeroline=False, showticklabels=False))
+    panels.append((verificationModeValue, "black"))
     
     # Helper function to format namespace filter data for table display
     def format_namespace_filter(filter_data, filter_type="inclusion"):
@@ -283,46 +417,30 @@ def gatherMetrics(connection_string):
     inclusionFilter = namespaceFilter.get("inclusionFilter") if namespaceFilter else None
     exclusionFilter = namespaceFilter.get("exclusionFilter") if namespaceFilter else None
     
-    # Create Inclusion Filter table
-    inc_keys, inc_values = format_namespace_filter(inclusionFilter, "inclusion")
-    fig.add_trace(go.Table(
-        header=dict(values=["Key", "Value"], font=dict(size=12, color='black')),
-        cells=dict(values=[inc_keys, inc_values], align=['left'], font=dict(size=10, color='darkblue')),
-        columnwidth=[0.75, 2.5]
-    ), row=3, col=1)
-    
-    # Create Exclusion Filter table
-    exc_keys, exc_values = format_namespace_filter(exclusionFilter, "exclusion")
-    fig.add_trace(go.Table(
-        header=dict(values=["Key", "Value"], font=dict(size=12, color='black')),
-        cells=dict(values=[exc_keys, exc_values], align=['left'], font=dict(size=10, color='darkblue')),
-        columnwidth=[0.75, 2.5]
-    ), row=3, col=4)
-    
-    # Update layout
-    fig.update_layout(height=650, width=1550, autosize=True, title_text="Mongosync Status - Timezone info: UTC", showlegend=False, plot_bgcolor="white")
-    
-    # Convert the figure to JSON
-    plot_json = json.dumps(fig, cls=PlotlyJSONEncoder)
+    # Filter table rows (inclusion, exclusion), rendered by the page below the figure
+    namespaceFilters = {}
+    for filterType, namespaceFilterValue in (("inclusion", inclusionFilter), ("exclusion", exclusionFilter)):
+        keys, values = format_namespace_filter(namespaceFilterValue, filterType)
+        namespaceFilters[filterType] = {'keys': keys, 'values': values}
+    
+    # Fill the prebuilt skeleton; only the text and colors change per request
+    skeleton_traces, layout = get_status_figure_skeleton()
+    data = [
+        dict(trace, text=[text], textfont=get_text_font(trace['textfont']['size'], color))
+        for trace, (text, color) in zip(skeleton_traces, panels)
+    ]
+    
+    # Convert the figure to JSON (uses orjson when installed)
+    plot_json = pio.json.to_json_plotly({'data': data, 'layout': layout, 'namespaceFilters': namespaceFilters})
     return plot_json
 
 
-def gatherPartitionsMetrics(connection_string):
-    """Generate progress view with partitions, data copy, phases, and collection progress."""
-    logger = logging.getLogger(__name__)
-    
-    from app_config import INTERNAL_DB_NAME, MAX_PARTITIONS_DISPLAY, get_database
-    
-    TARGET_MONGO_URI = connection_string
-    internalDb = INTERNAL_DB_NAME
-    
-    try:
-        internalDbDst = get_database(TARGET_MONGO_URI, internalDb)
-        logger.info("Connected to target MongoDB for progress metrics.")
-    except PyMongoError as e:
-        logger.error(f"Failed to connect to target MongoDB: {e}")
-        exit(1)
-    
+# Shown in place of a progress view chart without data; add() copies it before placing it
+PROGRESS_NO_DATA_TRACE = dict(type="scatter", x=[0], y=[0], text="NO DATA", mode='text', textfont=get_text_font(30, "black"))
+
+@lru_cache(maxsize=1)
+def get_progress_figure_skeleton():
+    """Build the static layout and trace placements of the progress view once."""
     # Create subplots for progress view (2x2 grid)
     fig = make_subplots(
         rows=2, 
@@ -338,11 +456,38 @@ def gatherPartitionsMetrics(connection_string):
         vertical_spacing=0.2
     )
     
-    # Get resumeData for phase transitions
-    vResumeData = internalDbDst.resumeData.find_one({"_id": "coordinator"})
-    phaseTransitions = vResumeData.get("phaseTransitions", []) if vResumeData else []
+    # Update layout
+    fig.update_layout(
+        height=900,
+        width=1550,
+        autosize=True,
+        title_text="Mongosync Progress - Timezone info: UTC",
+        showlegend=False,
+        plot_bgcolor="white"
+    )
     
-    # 1. Partitions Completed % (Row 1, Col 1)
+    return get_figure_skeleton(fig, [(1, 1), (1, 2), (2, 1), (2, 2)])
+
+def gatherPartitionsMetrics(client):
+    """Generate progress view with partitions, data copy, phases, and collection progress."""
+    from app_config import INTERNAL_DB_NAME, MAX_PARTITIONS_DISPLAY
+    
+    internalDbDst = client[INTERNAL_DB_NAME]
+    
+    # Traces are plain dicts placed into the prebuilt skeleton; layout holds the per-request axis settings
+    skeleton_layout, placements = get_progress_figure_skeleton()
+    traces = []
+    layout = {}
+    def add(trace, row, col):
+        traces.append(dict(trace, **placements[(row, col)]))
+    
+    # Get resumeData for phase transitions, overlapped with the partitions aggregation below
+    resumeDataFuture = query_executor.submit(internalDbDst.resumeData.find_one, {"_id": "coordinator"}, {"phaseTransitions": 1})
+    
+    # Partitions are scanned once; each facet feeds one of the charts below.
+    # $facet sub-pipelines cannot use indexes, and the internal database is
+    # owned by mongosync, so no index is created for this scan
+    # 1. Partitions Completed % per namespace, least completed first
     vGroup1 = {"$group": {"_id": {"namespace": {"$concat": ["$namespace.db", ".", "$namespace.coll"]}, "partitionPhase": "$partitionPhase" },  "documentCount": { "$sum": 1 }}}
     vGroup2 = {"$group": {  "_id": {  "namespace": "$_id.namespace"},  "partitionPhaseCounts": {  "$push": {  "k": "$_id.partitionPhase",  "v": "$documentCount"  }  },  "totalDocumentCount": { "$sum": "$documentCount" }  }  }
     vAddFields1 = {"$addFields": {"namespace": "$_id.namespace"}}
@@ -350,467 +495,500 @@ def gatherPartitionsMetrics(connection_string):
     vProject2 = {"$project": {  "_id": 0,"namespace": 1,"totalDocumentCount": 1,  "partitionPhaseCounts": {  "$mergeObjects": [  { "not started": 0, "in progress": 0, "done": 0 },  "$partitionPhaseCounts"  ]  }}  }
     vAddFields2 = {"$addFields": {"PercCompleted": {"$divide": [{ "$multiply": ["$partitionPhaseCounts.done", 100] }, "$totalDocumentCount"]}}}
     vSort1 = {"$sort": {"PercCompleted": 1, "namespace": 1}}  
-    vPartitionData = internalDbDst.partitions.aggregate([vGroup1, vGroup2, vAddFields1, vProject1, vProject2, vAddFields2, vSort1])
-
-    vPartitionData = list(vPartitionData)
-
-    # Limits the total of namespaces to MAX_PARTITIONS_DISPLAY in the partitions completed
+    # One extra namespace tells whether there are more than MAX_PARTITIONS_DISPLAY
+    vLimit1 = {"$limit": MAX_PARTITIONS_DISPLAY + 1}
+    
+    # 2. Total copied and total bytes
+    vGroup = {"$group":{"_id": None, "totalCopiedBytes": { "$sum": "$copiedByteCount" }, "totalBytesCount": { "$sum": "$totalByteCount" }  }}
+    
+    # 4. Number of collections per state (not started, in progress, completed),
+    # classified from each collection's set of partition phases
+    vGroup1b = {"$group": {  "_id": {  "$concat": ["$namespace.db", ".", "$namespace.coll"]  },  "phases": { "$addToSet": "$partitionPhase" }  } }
+    vGroup2b = {"$group": {  "_id": {  "$switch": {  "branches": [
+        {  "case": {  "$or": [  {"$in": ["in progress", "$phases"]},  {"$and": [{"$in": ["not started", "$phases"]}, {"$in": ["done", "$phases"]}]}  ]  },  "then": "In Progress"  },
+        {  "case": {"$in": ["not started", "$phases"]},  "then": "Not Started"  }
+    ],  "default": "Completed"  }  },  "count": { "$sum": 1 }  }}
+    
+    vFacets = next(internalDbDst.partitions.aggregate([{"$facet": {
+        "byNamespace": [vGroup1, vGroup2, vAddFields1, vProject1, vProject2, vAddFields2, vSort1, vLimit1],
+        "totals": [vGroup],
+        "collectionStates": [vGroup1b, vGroup2b]
+    }}]), {})
+    
+    vResumeData = resumeDataFuture.result()
+    phaseTransitions = vResumeData.get("phaseTransitions", []) if vResumeData else []
+    
+    # 1. Partitions Completed % (Row 1, Col 1)
+    vPartitionData = vFacets.get("byNamespace", [])
+    
+    # Limits the total of namespaces to MAX_PARTITIONS_DISPLAY in the partitions completed:
+    # incomplete namespaces come first (trimmed to MAX_PARTITIONS_DISPLAY-1 when they
+    # alone exceed the limit), filled up with completed ones
     if len(vPartitionData) > MAX_PARTITIONS_DISPLAY:  
-        # Remove PercCompleted == 100  
-        filtered = [doc for doc in vPartitionData if doc.get('PercCompleted') != 100]  
-        # If we still have more than MAX_PARTITIONS_DISPLAY, trim to MAX_PARTITIONS_DISPLAY  
-        if len(filtered) >= MAX_PARTITIONS_DISPLAY:  
-            vPartitionData = filtered[:MAX_PARTITIONS_DISPLAY-1]  
-        else:  
-            # If after removal less than MAX_PARTITIONS_DISPLAY, fill up with remaining PercCompleted==100  
-            needed = MAX_PARTITIONS_DISPLAY - len(filtered)  
-            completed_100 = [doc for doc in vPartitionData if doc.get('PercCompleted') == 100]  
-            vPartitionData = filtered + completed_100[:needed]  
+        vPartitionData = vPartitionData[:MAX_PARTITIONS_DISPLAY]  
+        if vPartitionData[-1].get('PercCompleted') != 100:  
+            vPartitionData = vPartitionData[:-1]  
 
     if len(vPartitionData) == 0:
-        fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', textfont=dict(size=30, color="black")), row=1, col=1)
-        fig.update_layout(xaxis1=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                          yaxis1=dict(showgrid=False, zeroline=False, showticklabels=False))
+        add(PROGRESS_NO_DATA_TRACE, 1, 1)
+        layout['xaxis'] = dict(showgrid=False, zeroline=False, showticklabels=False)
+        layout['yaxis'] = dict(showgrid=False, zeroline=False, showticklabels=False)
     else:
         vNamespace = []
         vPercComplete = []        
         for partition in vPartitionData:
             vNamespace.append(partition["namespace"])
             vPercComplete.append(partition["PercCompleted"])
-        fig.add_trace(go.Bar(x=vPercComplete, y=vNamespace, orientation='h', 
-                             marker=dict(color=vPercComplete, colorscale='blugrn')), row=1, col=1)
-        fig.update_xaxes(title_text="Completed %", row=1, col=1)
-        fig.update_yaxes(title_text="Namespace", row=1, col=1)
-        fig.update_layout(xaxis1=dict(range=[1, 100], dtick=5))
+        add(dict(type="bar", x=vPercComplete, y=vNamespace, orientation='h', 
+                 marker=dict(color=vPercComplete, colorscale=get_colorscale('blugrn'))), 1, 1)
+        layout['xaxis'] = dict(title=dict(text="Completed %"), range=[1, 100], dtick=5)
+        layout['yaxis'] = dict(title=dict(text="Namespace"))
 
     # 2. Total X Copied Data (Row 1, Col 2)
-    vGroup = {"$group":{"_id": None, "totalCopiedBytes": { "$sum": "$copiedByteCount" }, "totalBytesCount": { "$sum": "$totalByteCount" }  }}
-    vCompleteData = internalDbDst.partitions.aggregate([vGroup])
-    vCompleteData = list(vCompleteData)
+    vCompleteData = vFacets.get("totals", [])
     vCopiedBytes = 0
     vTotalBytes = 0
     vTypeByte = ['Copied Data', 'Total Data']
     vBytes = []
     if len(vCompleteData) == 0:
-        fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', textfont=dict(size=30, color="black")), row=1, col=2)
-        fig.update_layout(xaxis2=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                          yaxis2=dict(showgrid=False, zeroline=False, showticklabels=False))
+        add(PROGRESS_NO_DATA_TRACE, 1, 2)
+        layout['xaxis2'] = dict(showgrid=False, zeroline=False, showticklabels=False)
+        layout['yaxis2'] = dict(showgrid=False, zeroline=False, showticklabels=False)
     else:        
-        for comp in list(vCompleteData):
-            vCopiedBytes = comp["totalCopiedBytes"] + vCopiedBytes
-            vTotalBytes = comp["totalBytesCount"] + vTotalBytes
+        for comp in vCompleteData:
+            vCopiedBytes += comp["totalCopiedBytes"]
+            vTotalBytes += comp["totalBytesCount"]
         vTotalBytes, estimated_total_bytes_unit = format_byte_size(vTotalBytes)
         vCopiedBytes = convert_bytes(vCopiedBytes, estimated_total_bytes_unit)
         vBytes.append(vCopiedBytes)
         vBytes.append(vTotalBytes)
-        fig.add_trace(go.Bar(x=vBytes, y=vTypeByte, orientation='h',
-                             marker=dict(color=vBytes, colorscale='redor')), row=1, col=2)
-        fig.update_xaxes(title_text=f"Data in {estimated_total_bytes_unit}", row=1, col=2)
-        fig.update_yaxes(title_text="Copied / Total Data", row=1, col=2)
-        fig.update_layout(xaxis2=dict(range=[0, vTotalBytes]))
+        add(dict(type="bar", x=vBytes, y=vTypeByte, orientation='h',
+                 marker=dict(color=vBytes, colorscale=get_colorscale('redor'))), 1, 2)
+        layout['xaxis2'] = dict(title=dict(text=f"Data in {estimated_total_bytes_unit}"), range=[0, vTotalBytes])
+        layout['yaxis2'] = dict(title=dict(text="Copied / Total Data"))
 
     # 3. Mongosync Phases (Row 2, Col 1)
     vPhase = []
     vTs = []
     if len(phaseTransitions) == 0:
-        fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', textfont=dict(size=30, color="black")), row=2, col=1)
-        fig.update_layout(xaxis3=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                          yaxis3=dict(showgrid=False, zeroline=False, showticklabels=False))
+        add(PROGRESS_NO_DATA_TRACE, 2, 1)
+        layout['xaxis3'] = dict(showgrid=False, zeroline=False, showticklabels=False)
+        layout['yaxis3'] = dict(showgrid=False, zeroline=False, showticklabels=False)
     else:        
+        # Every transition is converted; bind the lookups once for the loop
+        fromtimestamp = datetime.fromtimestamp
+        utc = timezone.utc
         for pt in phaseTransitions:
             vPhase.append(pt.get("phase", "").capitalize())
             ts = pt.get("ts")
             if isinstance(ts, Timestamp):
-                vTs.append(datetime.fromtimestamp(ts.time, tz=timezone.utc))
+                vTs.append(fromtimestamp(ts.time, utc))
             elif isinstance(ts, datetime):
                 vTs.append(ts)
             else:
                 vTs.append(None)
-        fig.add_trace(go.Scatter(x=vTs, y=vPhase, mode='markers+text', marker=dict(color='green')), row=2, col=1)
+        add(dict(type="scatter", x=vTs, y=vPhase, mode='markers+text', marker=dict(color='green')), 2, 1)
     
     # 4. Collections Progress (Row 2, Col 2)
-    vProject1 = {"$project": {  "namespace": {  "$concat": ["$namespace.db", ".", "$namespace.coll"]  },  "partitionPhase": 1  }}
-    vGroup1 = {"$group": {  "_id": "$namespace",  "phases": { "$addToSet": "$partitionPhase" }  } }
-    vProject2 = {"$project": {  "_id": 0,  "namespace": "$_id",  "phases": {  "$arrayToObject": {  "$map": {  "input": "$phases",  "as": "phase",  "in": { "k": "$$phase", "v": 1 }  }  }  }  }}
-    vProject3 = {"$project": {  "_id": 0,"namespace": 1,  "phases": {  "$mergeObjects": [  { "not started": 0, "in progress": 0, "done": 0 },  "$phases"  ]  }}  }
-
-    vCollectionData = internalDbDst.partitions.aggregate([vProject1, vGroup1, vProject2, vProject3])
-    vCollectionData = list(vCollectionData)
+    vCollectionData = vFacets.get("collectionStates", [])
 
     vTypeProc = []
     vTypeValue = []
     if len(vCollectionData) == 0:
-        fig.add_trace(go.Scatter(x=[0], y=[0], text="NO DATA", mode='text', textfont=dict(size=30, color="black")), row=2, col=2)
-        fig.update_layout(xaxis4=dict(showgrid=False, zeroline=False, showticklabels=False), 
-                          yaxis4=dict(showgrid=False, zeroline=False, showticklabels=False))
+        add(PROGRESS_NO_DATA_TRACE, 2, 2)
+        layout['xaxis4'] = dict(showgrid=False, zeroline=False, showticklabels=False)
+        layout['yaxis4'] = dict(showgrid=False, zeroline=False, showticklabels=False)
     else:
-        NotStarted = 0
-        InProgress = 0
-        Done = 0
-        for collec in vCollectionData:
-            if ((collec["phases"]["in progress"] == 1) or (collec["phases"]["not started"] == 1 and collec["phases"]["done"] == 1)):
-                InProgress += 1
-            elif (collec["phases"]["not started"] == 1 and collec["phases"]["done"] != 1):
-                NotStarted += 1
-            else:
-                Done += 1
-            
-        vTypeProc.append("Not Started")
-        vTypeValue.append(NotStarted)
-        vTypeProc.append("In Progress")
-        vTypeValue.append(InProgress)
-        vTypeProc.append("Completed")
-        vTypeValue.append(Done)
+        vStateCounts = {state["_id"]: state["count"] for state in vCollectionData}
+        for vState in ("Not Started", "In Progress", "Completed"):
+            vTypeProc.append(vState)
+            vTypeValue.append(vStateCounts.get(vState, 0))
         xMax = max(vTypeValue)
 
-        fig.add_trace(go.Bar(x=vTypeValue, y=vTypeProc, orientation='h',
-                             marker=dict(color=vTypeValue, colorscale='Oryel')), row=2, col=2)
-        fig.update_xaxes(title_text="Totals", row=2, col=2)
-        fig.update_yaxes(title_text="Process", row=2, col=2)
-        fig.update_layout(xaxis4=dict(range=[0, xMax])) 
+        add(dict(type="bar", x=vTypeValue, y=vTypeProc, orientation='h',
+                   marker=dict(color=vTypeValue, colorscale=get_colorscale('Oryel'))), 2, 2)
+        layout['xaxis4'] = dict(title=dict(text="Totals"), range=[0, xMax])
+        layout['yaxis4'] = dict(title=dict(text="Process"))
+    
+    plot_json = pio.json.to_json_plotly({"data": traces, "layout": merge_layout(skeleton_layout, layout)})
+    return plot_json
+
+
+# Display helpers of the endpoint view, defined once rather than on every refresh
+def format_endpoint_value(value):
+    """Format a progress endpoint value for display."""
+    if value is None:
+        return "No Data"
+    elif isinstance(value, bool):
+        return str(value).capitalize()
+    elif isinstance(value, dict):
+        json_str = json.dumps(value, indent=2)
+        return (json_str[:100] + "...").capitalize() if len(json_str) > 100 else json_str.capitalize()
+    else:
+        str_value = str(value).strip()
+        if str_value == "" or str_value.upper() in ("N/A", "NULL", "NONE"):
+            return "No Data"
+        return str_value.capitalize()
+
+def get_endpoint_color(key, value):
+    """Get the text color of a progress endpoint value."""
+    if key == "state":
+        return ENDPOINT_STATE_COLORS.get(value, "black")
+    elif key in ["canCommit", "canWrite"]:
+        return "green" if value else "red"
+    return "black"
+
+def format_lag_seconds(seconds):
+    """Format a lag time in seconds as a human-readable string."""
+    if seconds is None:
+        return "No Data"
+    try:
+        total_seconds = int(seconds)
+        if total_seconds < 0:
+            return "0s"
+        days, remainder = divmod(total_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, secs = divmod(remainder, 60)
+        parts = []
+        if days > 0:
+            parts.append(f"{days}d")
+        if hours > 0:
+            parts.append(f"{hours}h")
+        if minutes > 0:
+            parts.append(f"{minutes}m")
+        parts.append(f"{secs}s")
+        return " ".join(parts)
+    except (ValueError, TypeError):
+        return "No Data"
+
+def dict_to_table(data):
+    """Convert a dict to the (keys, values) columns of a table."""
+    if not data or not isinstance(data, dict):
+        return ["Key"], ["No Data"]
+    keys = [str(k).capitalize() for k in data]
+    # Wrap values longer than 30 characters
+    values = [
+        "No Data" if v is None
+        else "<br>".join(TABLE_VALUE_WRAP_PATTERN.findall(val_str)) if len(val_str := str(v)) > 30
+        else val_str
+        for v in data.values()
+    ]
+    return keys, values
+
+def get_endpoint_layout_base(fig, height):
+    """Apply the layout shared by both figures of the endpoint view."""
+    # Hide the axes of the text panels; only the cells that are not pies or
+    # tables have axes, so no layout entries are added for the others
+    fig.update_xaxes(showgrid=False, zeroline=False, showticklabels=False)
+    fig.update_yaxes(showgrid=False, zeroline=False, showticklabels=False)
     
     # Update layout
     fig.update_layout(
-        height=900,
+        height=height,
         width=1550,
         autosize=True,
-        title_text="Mongosync Progress - Timezone info: UTC",
         showlegend=False,
         plot_bgcolor="white"
     )
     
-    plot_json = json.dumps(fig, cls=PlotlyJSONEncoder)
-    return plot_json
-
+    cells = [(row, col) for row in range(1, 3) for col in range(1, 5) if fig.get_subplot(row, col) is not None]
+    return get_figure_skeleton(fig, cells)
 
-def gatherEndpointMetrics(endpoint_url):
-    """Fetch and display data from the Mongosync Progress Endpoint URL."""
-    logger = logging.getLogger(__name__)
-    
-    # Create a figure for displaying endpoint data
+@lru_cache(maxsize=1)
+def get_endpoint_figure_skeleton():
+    """Build the static layout and trace placements of the endpoint overview once."""
+    # Create a figure for the state, lag and copy progress of the endpoint view
     fig = make_subplots(
-        rows=4,
+        rows=2,
         cols=4,
-        row_heights=[0.25, 0.25, 0.25, 0.25],
         subplot_titles=(
             "State", "Lag Time", "Can Commit", "Can Write",
-            "Info", "Mongosync ID", "Coordinator ID", "Collection Copy",
+            "Info", "Mongosync ID", "Coordinator ID", "Collection Copy"
+        ),
+        specs=[
+            [{}, {}, {}, {}],
+            [{}, {}, {}, {"type": "pie"}]
+        ],
+        horizontal_spacing=0.08,
+        vertical_spacing=0.24
+    )
+    return get_endpoint_layout_base(fig, 400)
+
+@lru_cache(maxsize=1)
+def get_endpoint_details_skeleton():
+    """Build the static layout and trace placements of the endpoint details once."""
+    # Create a figure for the tables and verifier progress of the endpoint view
+    fig = make_subplots(
+        rows=2,
+        cols=4,
+        subplot_titles=(
             "Direction Mapping", "Source", "Destination", "Events Applied",
             "Embedded Verifier Status", "Verifier Document Count"
         ),
         specs=[
-            [{}, {}, {}, {}],
-            [{}, {}, {}, {"type": "pie"}],
             [{"type": "table"}, {"type": "table"}, {"type": "table"}, {}],
             [{"type": "table", "colspan": 3}, None, None, {"type": "pie"}]
         ],
         horizontal_spacing=0.08,
-        vertical_spacing=0.12
+        vertical_spacing=0.24
     )
+    return get_endpoint_layout_base(fig, 400)
+
+def fetch_endpoint_progress(endpoint_url):
+    """
+    Fetch the progress document of a Mongosync Progress Endpoint URL.
     
-    try:
-        # Make HTTP GET request to the endpoint
+    The overview and details figures of the endpoint view are requested
+    separately, so the response is cached for the refresh interval and both
+    are built from a single HTTP request.
+    
+    Returns:
+        tuple: (raw response body, progress dict)
+    """
+    from app_config import get_cached_result
+    
+    def fetch():
         url = f"http://{endpoint_url}"
-        logger.info(f"Fetching data from endpoint: {url}")
-        response = requests.get(url, timeout=10)
+        logging.getLogger(__name__).info(f"Fetching data from endpoint: {url}")
+        response = endpoint_session.get(url, timeout=ENDPOINT_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        
-        # Extract progress data
-        progress = data.get("progress", {})
-        
-        # Helper function to format values for display
-        def format_value(value):
-            if value is None:
-                return "No Data"
-            elif isinstance(value, bool):
-                return str(value).capitalize()
-            elif isinstance(value, dict):
-                json_str = json.dumps(value, indent=2)
-                return (json_str[:100] + "...").capitalize() if len(json_str) > 100 else json_str.capitalize()
-            else:
-                str_value = str(value).strip()
-                if str_value == "" or str_value.upper() in ("N/A", "NULL", "NONE"):
-                    return "No Data"
-                return str_value.capitalize()
-        
-        # Helper function to get color based on value
-        def get_color(key, value):
-            if key == "state":
-                if value == "RUNNING":
-                    return "blue"
-                elif value == "IDLE":
-                    return "orange"
-                elif value == "COMMITTED":
-                    return "green"
-                elif value == "PAUSED":
-                    return "red"
-            elif key in ["canCommit", "canWrite"]:
-                return "green" if value else "red"
-            return "black"
-        
-        # Helper function to format lag time in seconds to human-readable format
-        def format_lag_time(seconds):
-            if seconds is None:
-                return "No Data"
-            try:
-                total_seconds = int(seconds)
-                if total_seconds < 0:
-                    return "0s"
-                days, remainder = divmod(total_seconds, 86400)
-                hours, remainder = divmod(remainder, 3600)
-                minutes, secs = divmod(remainder, 60)
-                parts = []
-                if days > 0:
-                    parts.append(f"{days}d")
-                if hours > 0:
-                    parts.append(f"{hours}h")
-                if minutes > 0:
-                    parts.append(f"{minutes}m")
-                parts.append(f"{secs}s")
-                return " ".join(parts)
-            except (ValueError, TypeError):
-                return "No Data"
-        
-        # Row 1: State, Lag Time, Can Commit, Can Write
-        state = progress.get("state", "N/A")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_value(state)], mode='text',
-                                  textfont=dict(size=20, color=get_color("state", state))), row=1, col=1)
-        
-        lagTime = progress.get("lagTimeSeconds")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_lag_time(lagTime)], mode='text',
-                                  textfont=dict(size=20, color="black")), row=1, col=2)
-        
-        canCommit = progress.get("canCommit", False)
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_value(canCommit)], mode='text',
-                                  textfont=dict(size=20, color=get_color("canCommit", canCommit))), row=1, col=3)
-        
-        canWrite = progress.get("canWrite", False)
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_value(canWrite)], mode='text',
-                                  textfont=dict(size=20, color=get_color("canWrite", canWrite))), row=1, col=4)
-        
-        # Row 2: Info, Mongosync ID, Coordinator ID, Collection Copy (pie chart)
-        info = progress.get("info")
-        infoText = "No Data" if info is None or str(info).strip() == "" else str(info).upper()
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[infoText], mode='text',
-                                  textfont=dict(size=16, color="black")), row=2, col=1)
-        
-        mongosyncID = progress.get("mongosyncID", "N/A")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_value(mongosyncID)], mode='text',
-                                  textfont=dict(size=16, color="black")), row=2, col=2)
-        
-        coordinatorID = progress.get("coordinatorID", "N/A")
-        coordText = format_value(coordinatorID) if coordinatorID else "No Data"
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[coordText], mode='text',
-                                  textfont=dict(size=16, color="black")), row=2, col=3)
-        
-        # Collection Copy (pie chart) - Row 2, Col 4
-        collectionCopy = progress.get("collectionCopy", {})
-        if collectionCopy and isinstance(collectionCopy, dict):
-            estimatedTotalBytes = collectionCopy.get("estimatedTotalBytes", 0) or 0
-            estimatedCopiedBytes = collectionCopy.get("estimatedCopiedBytes", 0) or 0
-            remainingBytes = max(0, estimatedTotalBytes - estimatedCopiedBytes)
-            
-            if estimatedTotalBytes > 0:
-                # Format bytes to human-readable format
-                copiedValue, copiedUnit = format_byte_size(estimatedCopiedBytes)
-                remainingValue, remainingUnit = format_byte_size(remainingBytes)
-                
-                # Create labels with formatted byte sizes
-                copiedLabel = f"Copied ({copiedValue:.2f} {copiedUnit})"
-                remainingLabel = f"Remaining ({remainingValue:.2f} {remainingUnit})"
-                
-                # Create pie chart with copied vs remaining bytes
-                fig.add_trace(go.Pie(
-                    labels=[copiedLabel, remainingLabel],
-                    values=[estimatedCopiedBytes, remainingBytes],
-                    marker=dict(colors=["green", "lightgray"]),
-                    textinfo="percent",
-                    textposition="outside",
-                    textfont=dict(size=12),
-                    hole=0.3,
-                    showlegend=True
-                ), row=2, col=4)
-            else:
-                fig.add_trace(go.Pie(
-                    labels=["No Data"],
-                    values=[1],
-                    marker=dict(colors=["lightgray"]),
-                    textinfo="label",
-                    textfont=dict(size=14),
-                    showlegend=False
-                ), row=2, col=4)
-        else:
-            fig.add_trace(go.Pie(
-                labels=["No Data"],
-                values=[1],
-                marker=dict(colors=["lightgray"]),
-                textinfo="label",
-                textfont=dict(size=14),
-                showlegend=False
-            ), row=2, col=4)
-        
-        # Helper function to create table data from dict
-        def dict_to_table(data):
-            if not data or not isinstance(data, dict):
-                return ["Key"], ["No Data"]
-            keys = []
-            values = []
-            for k, v in data.items():
-                # Wrap long values
-                key_str = str(k).capitalize()
-                val_str = str(v) if v is not None else "No Data"
-                # Wrap text if longer than 30 characters
-                if len(val_str) > 30:
-                    val_str = "<br>".join([val_str[i:i+30] for i in range(0, len(val_str), 30)])
-                keys.append(key_str)
-                values.append(val_str)
-            return keys, values
-        
-        # Row 3: Direction Mapping, Source, Destination, Events Applied
-        directionMapping = progress.get("directionMapping")
-        dm_keys, dm_values = dict_to_table(directionMapping)
-        fig.add_trace(go.Table(
-            header=dict(values=["Key", "Value"], font=dict(size=12, color='black')),
-            cells=dict(values=[dm_keys, dm_values], align=['left'], font=dict(size=10, color='darkblue')),
-            columnwidth=[0.75, 2.5]
-        ), row=3, col=1)
-        
-        source = progress.get("source")
-        src_keys, src_values = dict_to_table(source)
-        fig.add_trace(go.Table(
-            header=dict(values=["Key", "Value"], font=dict(size=12, color='black')),
-            cells=dict(values=[src_keys, src_values], align=['left'], font=dict(size=10, color='darkblue')),
-            columnwidth=[0.75, 2.5]
-        ), row=3, col=2)
-        
-        destination = progress.get("destination")
-        dst_keys, dst_values = dict_to_table(destination)
-        fig.add_trace(go.Table(
-            header=dict(values=["Key", "Value"], font=dict(size=12, color='black')),
-            cells=dict(values=[dst_keys, dst_values], align=['left'], font=dict(size=10, color='darkblue')),
-            columnwidth=[0.75, 2.5]
-        ), row=3, col=3)
-        
-        totalEventsApplied = progress.get("totalEventsApplied")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[format_value(totalEventsApplied)], mode='text',
-                                  textfont=dict(size=14, color="black")), row=3, col=4)
-        
-        # Row 4: Verification comparison table (source vs destination)
-        verification = progress.get("verification", {})
-        verif_source = verification.get("source", {}) if verification else {}
-        verif_dest = verification.get("destination", {}) if verification else {}
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, reported as an invalid response
+        return response.content, orjson.loads(response.content).get("progress", {})
+    
+    return get_cached_result(('endpoint_progress', endpoint_url), fetch)
+
+def add_endpoint_overview_traces(progress, add):
+    """Add the Row 1 and Row 2 traces of the endpoint view."""
+    # Row 1: State, Lag Time, Can Commit, Can Write
+    state = progress.get("state", "N/A")
+    add(dict(type="scatter", x=[0], y=[0], text=[format_endpoint_value(state)], mode='text',
+                              textfont=get_text_font(20, get_endpoint_color("state", state))), 1, 1)
+    
+    lagTime = progress.get("lagTimeSeconds")
+    add(dict(type="scatter", x=[0], y=[0], text=[format_lag_seconds(lagTime)], mode='text',
+                              textfont=get_text_font(20, "black")), 1, 2)
+    
+    canCommit = progress.get("canCommit", False)
+    add(dict(type="scatter", x=[0], y=[0], text=[format_endpoint_value(canCommit)], mode='text',
+                              textfont=get_text_font(20, get_endpoint_color("canCommit", canCommit))), 1, 3)
+    
+    canWrite = progress.get("canWrite", False)
+    add(dict(type="scatter", x=[0], y=[0], text=[format_endpoint_value(canWrite)], mode='text',
+                              textfont=get_text_font(20, get_endpoint_color("canWrite", canWrite))), 1, 4)
+    
+    # Row 2: Info, Mongosync ID, Coordinator ID, Collection Copy (pie chart)
+    info = progress.get("info")
+    infoText = "No Data" if info is None or str(info).strip() == "" else str(info).upper()
+    add(dict(type="scatter", x=[0], y=[0], text=[infoText], mode='text',
+                              textfont=get_text_font(16, "black")), 2, 1)
+    
+    mongosyncID = progress.get("mongosyncID", "N/A")
+    add(dict(type="scatter", x=[0], y=[0], text=[format_endpoint_value(mongosyncID)], mode='text',
+                              textfont=get_text_font(16, "black")), 2, 2)
+    
+    coordinatorID = progress.get("coordinatorID", "N/A")
+    coordText = format_endpoint_value(coordinatorID) if coordinatorID else "No Data"
+    add(dict(type="scatter", x=[0], y=[0], text=[coordText], mode='text',
+                              textfont=get_text_font(16, "black")), 2, 3)
+    
+    # Collection Copy (pie chart) - Row 2, Col 4
+    collectionCopy = progress.get("collectionCopy", {})
+    if not isinstance(collectionCopy, dict):
+        collectionCopy = {}
+    estimatedTotalBytes = collectionCopy.get("estimatedTotalBytes", 0) or 0
+    estimatedCopiedBytes = collectionCopy.get("estimatedCopiedBytes", 0) or 0
+    remainingBytes = max(0, estimatedTotalBytes - estimatedCopiedBytes)
+    
+    if estimatedTotalBytes > 0:
+        # Format bytes to human-readable format
+        copiedValue, copiedUnit = format_byte_size(estimatedCopiedBytes)
+        remainingValue, remainingUnit = format_byte_size(remainingBytes)
         
-        # Define the fields to compare
-        verif_fields = [
-            ("phase", "Phase"),
-            ("lagTimeSeconds", "Lag Time Seconds"), 
-            ("totalCollectionCount", "Total Collection Count"),
-            ("scannedCollectionCount", "Scanned Collection Count"),
-            ("hashedDocumentCount", "Hashed Document Count"),
-            ("estimatedDocumentCount", "Estimated Document Count")
-        ]
+        # Create labels with formatted byte sizes
+        copiedLabel = f"Copied ({copiedValue:.2f} {copiedUnit})"
+        remainingLabel = f"Remaining ({remainingValue:.2f} {remainingUnit})"
         
-        # Build table columns
-        field_names = []
+        # Create pie chart with copied vs remaining bytes
+        add(dict(
+            type="pie",
+            labels=[copiedLabel, remainingLabel],
+            values=[estimatedCopiedBytes, remainingBytes],
+            **PROGRESS_PIE_STYLE
+        ), 2, 4)
+    else:
+        add(NO_DATA_PIE, 2, 4)
+
+def add_endpoint_details_traces(progress, add):
+    """Add the Row 3 and Row 4 traces of the endpoint view."""
+    # Row 3: Direction Mapping, Source, Destination, Events Applied
+    for field, col in (("directionMapping", 1), ("source", 2), ("destination", 3)):
+        keys, values = dict_to_table(progress.get(field))
+        add(dict(
+            type="table",
+            header=KEY_VALUE_TABLE_HEADER,
+            cells=dict(values=[keys, values], **TABLE_CELL_STYLE),
+            columnwidth=KEY_VALUE_TABLE_COLUMN_WIDTH
+        ), 1, col)
+    
+    totalEventsApplied = progress.get("totalEventsApplied")
+    add(dict(type="scatter", x=[0], y=[0], text=[format_endpoint_value(totalEventsApplied)], mode='text',
+                              textfont=get_text_font(14, "black")), 1, 4)
+    
+    # Row 4: Verification comparison table (source vs destination)
+    verification = progress.get("verification", {})
+    verif_source = verification.get("source", {}) if verification else {}
+    verif_dest = verification.get("destination", {}) if verification else {}
+    
+    # Create verification comparison table; the columns are only built when
+    # the verifier reports something
+    if verification:
         source_values = []
         dest_values = []
-        
-        for field_key, field_label in verif_fields:
-            field_names.append(field_label)
-            
-            # Get source value
+        for field_key, _ in VERIFICATION_FIELDS:
             src_val = verif_source.get(field_key) if verif_source else None
             source_values.append(str(src_val) if src_val is not None else "No Data")
-            
-            # Get destination value
             dst_val = verif_dest.get(field_key) if verif_dest else None
             dest_values.append(str(dst_val) if dst_val is not None else "No Data")
+        add(dict(
+            type="table",
+            header=VERIFICATION_TABLE_HEADER,
+            cells=dict(values=[VERIFICATION_FIELD_LABELS, source_values, dest_values], **TABLE_CELL_STYLE),
+            columnwidth=VERIFICATION_TABLE_COLUMN_WIDTH
+        ), 2, 1)
+    else:
+        add(dict(
+            type="table",
+            header=VERIFICATION_TABLE_HEADER,
+            cells=dict(values=[["Verification"], ["No Data"], ["No Data"]], **TABLE_CELL_STYLE),
+            columnwidth=VERIFICATION_TABLE_COLUMN_WIDTH
+        ), 2, 1)
+    
+    # Verifier Document Count pie chart (Verified vs Remaining)
+    src_estimated_docs = verif_source.get("estimatedDocumentCount", 0) or 0 if verif_source else 0
+    dst_estimated_docs = verif_dest.get("estimatedDocumentCount", 0) or 0 if verif_dest else 0
+    
+    # Verified Documents = src_estimated_docs (documents already verified)
+    # Remaining Documents = dst_estimated_docs - src_estimated_docs (documents left to verify)
+    verified_docs = dst_estimated_docs
+    remaining_docs = max(0,  src_estimated_docs - dst_estimated_docs)
+    
+    if verified_docs > 0 or remaining_docs > 0:
+        add(dict(
+            type="pie",
+            labels=[f"Verified ({verified_docs:,})", f"Remaining ({remaining_docs:,})"],
+            values=[verified_docs, remaining_docs],
+            **PROGRESS_PIE_STYLE
+        ), 2, 4)
+    else:
+        add(NO_DATA_PIE, 2, 4)
+
+# Figures of the endpoint view: (skeleton builder, trace builder)
+ENDPOINT_VIEWS = {
+    "overview": (get_endpoint_figure_skeleton, add_endpoint_overview_traces),
+    "details": (get_endpoint_details_skeleton, add_endpoint_details_traces),
+}
+
+@lru_cache(maxsize=64)
+def get_endpoint_error_json(view, endpoint_url, message, size=20):
+    """
+    Serialize the figure shown in place of an endpoint view figure when the endpoint can't be read.
+    
+    The overview is replaced by the error message alone rather than empty
+    panels around it, and the details keep their empty panels. Each is
+    built once per endpoint and error message.
+    """
+    if view == "details":
+        skeleton_layout, _ = get_endpoint_details_skeleton()
+        return pio.json.to_json_plotly({"data": [], "layout": skeleton_layout})
+    
+    hidden_axis = dict(showgrid=False, zeroline=False, showticklabels=False)
+    layout = {
+        "title": {"text": f"Mongosync Endpoint Data - {endpoint_url}"},
+        "height": 250,
+        "width": 1550,
+        "autosize": True,
+        "showlegend": False,
+        "plot_bgcolor": "white",
+        "xaxis": hidden_axis,
+        "yaxis": hidden_axis
+    }
+    return pio.json.to_json_plotly({"data": [error_text_trace(message, size)], "layout": layout})
+
+def gather_endpoint_view(endpoint_url, view):
+    """Build the plot JSON of one figure of the endpoint view."""
+    logger = logging.getLogger(__name__)
+    get_skeleton, add_view_traces = ENDPOINT_VIEWS[view]
+    
+    # Traces are plain dicts placed into the prebuilt skeleton
+    skeleton_layout, placements = get_skeleton()
+    traces = []
+    def add(trace, row, col):
+        traces.append(dict(trace, **placements[(row, col)]))
+    
+    try:
+        payload, progress = fetch_endpoint_progress(endpoint_url)
+        cached = endpoint_plot_cache.get((view, endpoint_url))
+        if cached is not None and cached[0] == payload:
+            return cached[1]
         
-        # Create verification comparison table
-        if verification:
-            fig.add_trace(go.Table(
-                header=dict(values=["Field", "Source", "Destination"], font=dict(size=12, color='black')),
-                cells=dict(values=[field_names, source_values, dest_values], align=['left'], font=dict(size=10, color='darkblue')),
-                columnwidth=[1.5, 1, 1]
-            ), row=4, col=1)
-        else:
-            fig.add_trace(go.Table(
-                header=dict(values=["Field", "Source", "Destination"], font=dict(size=12, color='black')),
-                cells=dict(values=[["Verification"], ["No Data"], ["No Data"]], align=['left'], font=dict(size=10, color='darkblue')),
-                columnwidth=[1.5, 1, 1]
-            ), row=4, col=1)
-        
-        # Verifier Document Count pie chart (Verified vs Remaining)
-        src_estimated_docs = verif_source.get("estimatedDocumentCount", 0) or 0 if verif_source else 0
-        dst_estimated_docs = verif_dest.get("estimatedDocumentCount", 0) or 0 if verif_dest else 0
-        
-        # Verified Documents = src_estimated_docs (documents already verified)
-        # Remaining Documents = dst_estimated_docs - src_estimated_docs (documents left to verify)
-        verified_docs = dst_estimated_docs
-        remaining_docs = max(0,  src_estimated_docs - dst_estimated_docs)
-        
-        if verified_docs > 0 or remaining_docs > 0:
-            fig.add_trace(go.Pie(
-                labels=[f"Verified ({verified_docs:,})", f"Remaining ({remaining_docs:,})"],
-                values=[verified_docs, remaining_docs],
-                marker=dict(colors=["green", "lightgray"]),
-                textinfo="percent",
-                textposition="outside",
-                textfont=dict(size=12),
-                hole=0.3,
-                showlegend=True
-            ), row=4, col=4)
-        else:
-            fig.add_trace(go.Pie(
-                labels=["No Data"],
-                values=[1],
-                marker=dict(colors=["lightgray"]),
-                textinfo="label",
-                textfont=dict(size=14),
-                showlegend=False
-            ), row=4, col=4)
+        add_view_traces(progress, add)
         
     except requests.exceptions.Timeout:
         logger.error(f"Timeout connecting to endpoint: {endpoint_url}")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=["TIMEOUT - Could not reach endpoint"], mode='text',
-                                  textfont=dict(size=20, color="red")), row=1, col=1)
+        return get_endpoint_error_json(view, endpoint_url, "TIMEOUT - Could not reach endpoint")
     except requests.exceptions.ConnectionError as e:
         logger.error(f"Connection error to endpoint {endpoint_url}: {e}")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=["CONNECTION ERROR"], mode='text',
-                                  textfont=dict(size=20, color="red")), row=1, col=1)
+        return get_endpoint_error_json(view, endpoint_url, "CONNECTION ERROR")
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error to endpoint {endpoint_url}: {e}")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=["REQUEST ERROR"], mode='text',
-                                  textfont=dict(size=20, color="red")), row=1, col=1)
+        return get_endpoint_error_json(view, endpoint_url, "REQUEST ERROR")
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON response from endpoint {endpoint_url}: {e}")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=["INVALID JSON RESPONSE"], mode='text',
-                                  textfont=dict(size=20, color="red")), row=1, col=1)
+        return get_endpoint_error_json(view, endpoint_url, "INVALID JSON RESPONSE")
     except Exception as e:
         logger.error(f"Unexpected error fetching endpoint data: {e}")
-        fig.add_trace(go.Scatter(x=[0], y=[0], text=[f"ERROR: {str(e)[:50]}"], mode='text',
-                                  textfont=dict(size=16, color="red")), row=1, col=1)
+        return get_endpoint_error_json(view, endpoint_url, f"ERROR: {str(e)[:50]}", size=16)
     
-    # Hide all axes (4 rows x 4 cols = 16 potential axes)
-    for i in range(1, 17):
-        fig.update_layout(**{
-            f'xaxis{i}': dict(showgrid=False, zeroline=False, showticklabels=False),
-            f'yaxis{i}': dict(showgrid=False, zeroline=False, showticklabels=False)
-        })
+    if view == "overview":
+        layout = merge_layout(skeleton_layout, {"title": {"text": f"Mongosync Endpoint Data - {endpoint_url}"}})
+    else:
+        layout = skeleton_layout
+    plot_json = pio.json.to_json_plotly({"data": traces, "layout": layout})
+    
+    # Keep the plot with the response body it was built from for reuse
+    with endpoint_plot_cache_lock:
+        endpoint_plot_cache.pop((view, endpoint_url), None)
+        endpoint_plot_cache[(view, endpoint_url)] = (payload, plot_json)
+        if len(endpoint_plot_cache) > ENDPOINT_PLOT_CACHE_SIZE:
+            # Drop the least recently plotted figure
+            del endpoint_plot_cache[next(iter(endpoint_plot_cache))]
+    return plot_json
+
+def gatherEndpointMetrics(endpoint_url):
+    """Fetch and display the state, lag and copy progress from the Mongosync Progress Endpoint URL."""
+    return gather_endpoint_view(endpoint_url, "overview")
+
+def gatherEndpointDetails(endpoint_url):
+    """
+    Fetch and display the tables and verifier progress from the Mongosync Progress Endpoint URL.
     
-    # Update layout
-    fig.update_layout(
-        height=800,
-        width=1550,
-        autosize=True,
-        title_text=f"Mongosync Endpoint Data - {endpoint_url}",
-        showlegend=False,
-        plot_bgcolor="white"
-    )
+    These are below the fold of the endpoint tab, so the dashboard only
+    requests them once they are scrolled into view.
+    """
+    return gather_endpoint_view(endpoint_url, "details")
+
+
+def build_figure_skeletons():
+    """
+    Build the cached skeletons of all live monitoring views.
     
-    plot_json = json.dumps(fig, cls=PlotlyJSONEncoder)
-    return plot_json
+    Called at startup so make_subplots (the slow part of building a figure)
+    runs before the first dashboard request instead of during it.
+    """
+    get_status_figure_skeleton()
+    get_progress_figure_skeleton()
+    get_endpoint_figure_skeleton()
+    get_endpoint_details_skeleton()
 
 
 def plotMetrics(has_connection_string=True, has_endpoint_url=False):
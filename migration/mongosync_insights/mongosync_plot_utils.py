@@ -1,44 +1,83 @@
+import json
+import plotly.io as pio
+
+# Conversion factors, largest first
+KILOBYTE = 1024
+MEGABYTE = KILOBYTE * 1024
+GIGABYTE = MEGABYTE * 1024
+TERABYTE = GIGABYTE * 1024
+BYTE_UNITS = (
+    (TERABYTE, 'TeraBytes'),
+    (GIGABYTE, 'GigaBytes'),
+    (MEGABYTE, 'MegaBytes'),
+    (KILOBYTE, 'KiloBytes'),
+)
+BYTE_UNIT_FACTORS = {unit: factor for factor, unit in BYTE_UNITS}
+
 def format_byte_size(bytes):
-    # Define the conversion factors
-    kilobyte = 1024
-    megabyte = kilobyte * 1024
-    gigabyte = megabyte * 1024
-    terabyte = gigabyte * 1024
     # Determine the appropriate unit and calculate the value
-    if bytes >= terabyte:
-        value = bytes / terabyte
-        unit = 'TeraBytes'
-    elif bytes >= gigabyte:
-        value = bytes / gigabyte
-        unit = 'GigaBytes'
-    elif bytes >= megabyte:
-        value = bytes / megabyte
-        unit = 'MegaBytes'
-    elif bytes >= kilobyte:
-        value = bytes / kilobyte
-        unit = 'KiloBytes'
-    else:
-        value = bytes
-        unit = 'Bytes'
-    # Return the value rounded to two decimal places and the unit separately
-    return round(value, 4), unit
+    for factor, unit in BYTE_UNITS:
+        if bytes >= factor:
+            # Return the value rounded to four decimal places and the unit separately
+            return round(bytes / factor, 4), unit
+    return round(bytes, 4), 'Bytes'
 
 def convert_bytes(bytes, target_unit):
-    # Define conversion factors
-    kilobyte = 1024
-    megabyte = kilobyte * 1024
-    gigabyte = megabyte * 1024
-    terabyte = gigabyte * 1024
     # Perform conversion based on target unit
-    if target_unit == 'KiloBytes':
-        value = bytes / kilobyte
-    elif target_unit == 'MegaBytes':
-        value = bytes / megabyte
-    elif target_unit == 'GigaBytes':
-        value = bytes / gigabyte
-    elif target_unit == 'TeraBytes':
-        value = bytes / terabyte
-    else:
-        value = bytes
-    # Return the converted value rounded to two decimal places and the unit
-    return round(value, 4)
\ No newline at end of file
+    factor = BYTE_UNIT_FACTORS.get(target_unit)
+    value = bytes / factor if factor else bytes
+    # Return the converted value rounded to four decimal places
+    return round(value, 4)
+
+def get_cell_placement(fig, row, col):
+    """Get the trace properties that place a trace in the given subplot cell."""
+    subplot = fig.get_subplot(row, col)
+    if hasattr(subplot, "xaxis"):
+        # Each axis is anchored to the other axis of its cell
+        return {"xaxis": subplot.yaxis.anchor, "yaxis": subplot.xaxis.anchor}
+    return {"domain": {"x": list(subplot.x), "y": list(subplot.y)}}
+
+def get_figure_skeleton(fig, cells):
+    """
+    Convert a figure with the static layout of a view into plain JSON-ready dicts.
+    
+    Args:
+        fig: Figure returned by make_subplots, with the static layout applied
+        cells: (row, col) of each subplot cell traces are added to
+        
+    Returns:
+        tuple: (layout dict, {(row, col): trace placement properties})
+    """
+    layout = json.loads(pio.to_json(fig, validate=False))["layout"]
+    return layout, {(row, col): get_cell_placement(fig, row, col) for row, col in cells}
+
+def downsample_min_max(x, y, max_points):
+    """
+    Reduce a time series to at most max_points points for plotting.
+    
+    The series is split into max_points // 2 evenly sized intervals and the
+    minimum and maximum of each are kept in their original order, so spikes
+    remain visible while the browser only draws what fits on screen.
+    
+    Args:
+        x (list): X values (e.g. times)
+        y (list): Y values; None values are only kept when a whole interval has no other value
+        max_points (int): Maximum number of points to return, 0 for no limit
+        
+    Returns:
+        tuple: (x, y) lists
+    """
+    count = min(len(x), len(y))
+    if not max_points or count <= max_points:
+        return x, y
+    
+    buckets = max_points // 2
+    indexes = []
+    for bucket in range(buckets):
+        start = bucket * count // buckets
+        end = (bucket + 1) * count // buckets
+        candidates = [i for i in range(start, end) if y[i] is not None] or [start]
+        low = min(candidates, key=y.__getitem__)
+        high = max(candidates, key=y.__getitem__)
+        indexes.extend(sorted({low, high}))
+    return [x[i] for i in indexes], [y[i] for i in indexes]